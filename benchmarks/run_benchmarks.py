@@ -2,10 +2,20 @@
 CLI for running benchmarks and comparing results.
 """
 import argparse
+import hashlib
+import mmap
+import os
+import pickle
 import sys
 from pathlib import Path
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / "Texting"))
@@ -15,11 +25,70 @@ from benchmarks.bench_search import run_all_search_benchmarks
 from benchmarks.config import RESULTS_DIR
 
 
-def compare_results(baseline_file: Path, current_file: Path):
+# Parsed {name: result} indexes keyed by results-file content hash
+PARSE_CACHE_DIR = Path.home() / ".cache" / "imessage-mcp" / "bench"
+
+
+def _parse_results(buf) -> list:
+    """Parse a results buffer (orjson when available, stdlib json otherwise)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(buf)
+    return json.loads(bytes(buf))
+
+
+def _load_indexed_results(path: Path) -> dict:
+    """
+    Load a benchmark results file as {name: result}.
+
+    The file is mmap'd and hashed (blake2b); an unchanged file is served
+    from a pickled index in PARSE_CACHE_DIR instead of being re-parsed.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            results = _parse_results(b"")  # raises JSONDecodeError
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                digest = hashlib.blake2b(buf, digest_size=16).hexdigest()
+                cache_file = PARSE_CACHE_DIR / f"{digest}.pkl"
+                try:
+                    return pickle.loads(cache_file.read_bytes())
+                except (OSError, pickle.UnpicklingError, EOFError):
+                    pass
+
+                with memoryview(buf) as view:
+                    results = _parse_results(view)
+
+    indexed = {r["name"]: r for r in results}
+
+    try:
+        PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".tmp{os.getpid()}")
+        tmp_file.write_bytes(pickle.dumps(indexed, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Cache is best-effort
+
+    return indexed
+
+
+# compare_results output, formatted once per entry instead of per-line f-strings
+COMPARE_TEMPLATE = (
+    "\n{sym} {name}\n"
+    "  Baseline: {b:.3f}s\n"
+    "  Current:  {c:.3f}s\n"
+    "  Change:   {d:+.1f}%"
+)
+COMPARE_ZERO_TEMPLATE = "\n{sym} {name}\n  Baseline: {b:.3f}s (zero - skipped)"
+
+# (improved, stable, regressed) markers
+EMOJI_SYMBOLS = ("🟢", "⚪", "🔴")
+ASCII_SYMBOLS = ("[+]", "[=]", "[-]")
+
+
+def compare_results(baseline_file: Path, current_file: Path, ascii: bool = False):
     """Compare two benchmark result files and show regression/improvement."""
     try:
-        with open(baseline_file) as f:
-            baseline = {r["name"]: r for r in json.load(f)}
+        baseline = _load_indexed_results(baseline_file)
     except FileNotFoundError:
         print(f"ERROR: Baseline file not found: {baseline_file}")
         return
@@ -28,8 +97,7 @@ def compare_results(baseline_file: Path, current_file: Path):
         return
 
     try:
-        with open(current_file) as f:
-            current = {r["name"]: r for r in json.load(f)}
+        current = _load_indexed_results(current_file)
     except FileNotFoundError:
         print(f"ERROR: Current file not found: {current_file}")
         return
@@ -37,40 +105,40 @@ def compare_results(baseline_file: Path, current_file: Path):
         print(f"ERROR: Invalid JSON in current file: {e}")
         return
 
-    print("\n" + "="*80)
-    print("PERFORMANCE COMPARISON")
-    print("="*80)
+    improved, stable, regressed = ASCII_SYMBOLS if ascii else EMOJI_SYMBOLS
+    rule = "=" * 80
+    out = ["\n" + rule, "PERFORMANCE COMPARISON", rule]
 
     for name in sorted(current.keys()):
         if name not in baseline:
-            print(f"\n{name}: NEW (no baseline)")
+            out.append(f"\n{name}: NEW (no baseline)")
             continue
 
         base_time = baseline[name]["elapsed_seconds"]
         curr_time = current[name]["elapsed_seconds"]
 
         if base_time == 0:
-            print(f"\n⚪ {name}")
-            print(f"  Baseline: {base_time:.3f}s (zero - skipped)")
+            out.append(COMPARE_ZERO_TEMPLATE.format(sym=stable, name=name, b=base_time))
             continue
 
         delta = ((curr_time - base_time) / base_time) * 100
-        symbol = "🔴" if delta > 10 else "🟢" if delta < -10 else "⚪"
+        symbol = regressed if delta > 10 else improved if delta < -10 else stable
 
-        print(f"\n{symbol} {name}")
-        print(f"  Baseline: {base_time:.3f}s")
-        print(f"  Current:  {curr_time:.3f}s")
-        print(f"  Change:   {delta:+.1f}%")
+        out.append(COMPARE_TEMPLATE.format(
+            sym=symbol, name=name, b=base_time, c=curr_time, d=delta
+        ))
 
         # Show metrics if available
-        if "metrics" in current[name] and current[name]["metrics"]:
-            print(f"  Metrics: {current[name]['metrics']}")
+        metrics = current[name].get("metrics")
+        if metrics:
+            out.append(f"  Metrics: {metrics}")
 
-    print("\n" + "="*80)
-    print(f"\n🟢 = Improved (>10% faster)")
-    print(f"⚪ = Stable (within 10%)")
-    print(f"🔴 = Regressed (>10% slower)")
-    print()
+    out.append("\n" + rule)
+    out.append(f"\n{improved} = Improved (>10% faster)")
+    out.append(f"{stable} = Stable (within 10%)")
+    out.append(f"{regressed} = Regressed (>10% slower)")
+    out.append("")
+    print("\n".join(out))
 
 
 def main():
@@ -91,6 +159,11 @@ def main():
         action="store_true",
         help="Save current results as baseline for future comparisons"
     )
+    parser.add_argument(
+        "--ascii",
+        action="store_true",
+        help="Use ASCII markers instead of emoji in --compare output"
+    )
 
     args = parser.parse_args()
 
@@ -139,7 +212,7 @@ def main():
             return
 
         if current.exists():
-            compare_results(args.compare, current)
+            compare_results(args.compare, current, ascii=args.ascii)
         else:
             print(f"ERROR: No current results found at {current}")
 
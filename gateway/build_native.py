@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Build a native, single-file iMessage Gateway CLI with Nuitka.
+
+Compiles gateway/imessage_client.py and the src package ahead of time into
+one executable. Its modules are frozen into the binary, so a call skips
+.py/.pyc discovery and most of the import machinery that a `python3
+gateway/imessage_client.py` start pays for.
+
+The heavy optional RAG dependencies (chromadb, sentence-transformers,
+openai) are left out, so `search`/`index` report them as missing in the
+native binary. config/contacts.json is embedded as it was at build time:
+rebuild after syncing contacts, and use the Python CLI for add-contact.
+
+Requires Nuitka (pip install nuitka) and a C compiler.
+
+Usage:
+    python3 gateway/build_native.py
+    python3 gateway/benchmarks.py --native --quick   # Compare startup with the Python CLI
+    .cache/native/imessage_client_native recent --limit 10
+"""
+
+import argparse
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+REPO_ROOT = SCRIPT_DIR.parent
+
+CLI_PATH = SCRIPT_DIR / "imessage_client.py"
+CONTACTS_CONFIG = REPO_ROOT / "config" / "contacts.json"
+NATIVE_DIR = REPO_ROOT / ".cache" / "native"
+NATIVE_BINARY = NATIVE_DIR / "imessage_client_native"
+
+# Imported lazily by the RAG commands only; compiling them in would add
+# hundreds of MB to the binary for commands that rarely need to be fast.
+EXCLUDED_IMPORTS = ("chromadb", "sentence_transformers", "openai")
+
+
+def nuitka_command(output: Path) -> list:
+    """Build the Nuitka argv that compiles the CLI into `output`."""
+    cmd = [
+        sys.executable, "-m", "nuitka",
+        "--onefile",
+        "--follow-imports",
+        "--include-package=src",
+        f"--nofollow-import-to={','.join(EXCLUDED_IMPORTS)}",
+        f"--output-dir={output.parent}",
+        f"--output-filename={output.name}",
+        "--remove-output",
+    ]
+    if CONTACTS_CONFIG.exists():
+        cmd.append(f"--include-data-file={CONTACTS_CONFIG}=config/contacts.json")
+    cmd.append(str(CLI_PATH))
+    return cmd
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the native iMessage Gateway CLI")
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=NATIVE_BINARY,
+        help=f"Path of the built executable (default: {NATIVE_BINARY.relative_to(REPO_ROOT)})"
+    )
+    args = parser.parse_args()
+
+    if importlib.util.find_spec("nuitka") is None:
+        print("Error: Nuitka not installed. Run: pip install nuitka", file=sys.stderr)
+        return 1
+    if not CONTACTS_CONFIG.exists():
+        print(f"Warning: {CONTACTS_CONFIG} not found; building without contacts", file=sys.stderr)
+
+    output = args.output.resolve()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    result = subprocess.run(nuitka_command(output), cwd=str(REPO_ROOT))
+    if result.returncode != 0:
+        return result.returncode
+
+    print(f"Built {output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
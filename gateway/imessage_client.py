@@ -19,47 +19,245 @@ Usage:
     python3 gateway/imessage_client.py analytics "Sarah" --days 30
     python3 gateway/imessage_client.py search "dinner plans"    # Semantic search (RAG)
     python3 gateway/imessage_client.py index --source=imessage  # Index for RAG
+    python3 gateway/imessage_client.py daemon                   # Serve gateway/imessage_client_fast.py
 """
 
 import sys
-import argparse
-import json
 from pathlib import Path
+from types import SimpleNamespace
 
 # Add parent directory to path for imports
 SCRIPT_DIR = Path(__file__).parent
-REPO_ROOT = SCRIPT_DIR.parent
-sys.path.insert(0, str(REPO_ROOT))
+# A Nuitka build (gateway/build_native.py) unpacks its data files, including
+# config/contacts.json, next to the compiled module
+REPO_ROOT = SCRIPT_DIR if "__compiled__" in globals() else SCRIPT_DIR.parent
+# Already there when gateway/install_pth.py has been run for this interpreter.
+# The .pth file holds the resolved path, so compare against that (the repo
+# may be reached through a symlink)
+_REPO_ROOT_STR = str(REPO_ROOT.resolve())
+if _REPO_ROOT_STR not in sys.path:
+    sys.path.insert(0, _REPO_ROOT_STR)
 
-try:
-    from src.messages_interface import MessagesInterface
-    from src.contacts_manager import ContactsManager
-except ImportError as e:
+# Default config path (relative to repo root)
+CONTACTS_CONFIG = REPO_ROOT / "config" / "contacts.json"
+
+# Parsed contacts.json, keyed by its path/mtime/size (see load_contacts_cached)
+CONTACTS_CACHE = Path.home() / ".cache" / "imessage-gateway" / "contacts.marshal"
+
+# MessagesInterface's default database
+MESSAGES_DB = Path.home() / "Library" / "Messages" / "chat.db"
+
+# Valid RAG sources (single source of truth)
+VALID_RAG_SOURCES = ['imessage', 'superwhisper', 'notes', 'local', 'gmail', 'slack', 'calendar']
+
+
+# Default Unix socket for `daemon` / gateway/imessage_client_fast.py; both
+# honour IMESSAGE_GATEWAY_SOCKET (see _add_daemon_parser)
+DAEMON_SOCKET = Path.home() / ".cache" / "imessage-gateway.sock"
+DAEMON_SOCKET_ENV = "IMESSAGE_GATEWAY_SOCKET"
+
+# Process-wide instances, created on first use (see get_interfaces)
+_resident_messages = None
+_resident_contacts = None
+_resident_contacts_mtime = None
+
+
+def _exit_import_error(e):
     print(f"Error: Could not import modules: {e}")
     print(f"Make sure you're running from the imessage-mcp repository root")
     print(f"Expected path: {REPO_ROOT}")
     sys.exit(1)
 
-# Default config path (relative to repo root)
-CONTACTS_CONFIG = REPO_ROOT / "config" / "contacts.json"
 
-# Valid RAG sources (single source of truth)
-VALID_RAG_SOURCES = ['imessage', 'superwhisper', 'notes', 'local', 'gmail', 'slack', 'calendar']
+def prefetch_file(path):
+    """
+    Ask the kernel to start reading a file into the page cache (best-effort).
+
+    Returns immediately; the reads overlap with whatever runs next (module
+    imports, contacts parsing) instead of stalling the first SQLite query.
+    """
+    import os
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        elif sys.platform == 'darwin':
+            import fcntl
+            import struct
+            # struct radvisory { off_t ra_offset; int ra_count; } (+ padding)
+            count = min(os.fstat(fd).st_size, 0x7FFFFFFF)
+            fcntl.fcntl(fd, getattr(fcntl, 'F_RDADVISE', 44), struct.pack('qi4x', 0, count))
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def get_messages_interface():
+    """Return the process-wide MessagesInterface (imported on first use)."""
+    global _resident_messages
+    if _resident_messages is not None:
+        return _resident_messages
+    # Start pulling chat.db (and its WAL) into the page cache while we import
+    prefetch_file(MESSAGES_DB)
+    prefetch_file(f"{MESSAGES_DB}-wal")
+    try:
+        from src.messages_interface import MessagesInterface
+    except ImportError as e:
+        _exit_import_error(e)
+    _resident_messages = MessagesInterface()
+    return _resident_messages
+
+
+def load_contacts_cached(path):
+    """
+    Build a ContactsManager, reusing a marshal'd copy of the parsed contacts.
+
+    The cache is keyed by (path, mtime_ns, size) of the JSON config, so any
+    edit (including add-contact) invalidates it.
+    """
+    import os
+    import marshal
+    from operator import methodcaller
+
+    try:
+        from src.contacts_manager import ContactsManager
+    except ImportError as e:
+        _exit_import_error(e)
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        return ContactsManager(str(path))  # Creates the default config
+    key = (str(path), st.st_mtime_ns, st.st_size)
+
+    try:
+        with open(CONTACTS_CACHE, 'rb') as f:
+            cached_key, contacts_data = marshal.load(f)
+        if cached_key == key:
+            return ContactsManager(str(path), contacts_data=contacts_data)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    cm = ContactsManager(str(path))
+    try:
+        CONTACTS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CONTACTS_CACHE.with_suffix(f".tmp{os.getpid()}")
+        contacts_data = list(map(methodcaller('to_dict'), cm.contacts))
+        tmp.write_bytes(marshal.dumps((key, contacts_data)))
+        os.replace(tmp, CONTACTS_CACHE)
+    except OSError:
+        pass  # Cache is best-effort
+    return cm
+
+
+def _contacts_mtime():
+    """mtime_ns of the contacts config, or None if it doesn't exist."""
+    try:
+        return CONTACTS_CONFIG.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_contacts_manager():
+    """
+    Return the process-wide ContactsManager (imported on first use).
+
+    Reloaded when contacts.json changes on disk, so a resident process
+    (daemon, repl) picks up add-contact from another worker or a re-sync.
+    """
+    global _resident_contacts, _resident_contacts_mtime
+    if _resident_contacts is not None:
+        mtime = _contacts_mtime()
+        if mtime == _resident_contacts_mtime:
+            return _resident_contacts
+        _resident_contacts_mtime = mtime
+    else:
+        _resident_contacts_mtime = _contacts_mtime()
+    _resident_contacts = load_contacts_cached(CONTACTS_CONFIG)
+    return _resident_contacts
 
 
 def get_interfaces():
-    """Initialize MessagesInterface and ContactsManager."""
-    mi = MessagesInterface()
-    cm = ContactsManager(str(CONTACTS_CONFIG))
-    return mi, cm
+    """Return the process-wide MessagesInterface and ContactsManager."""
+    return get_messages_interface(), get_contacts_manager()
+
 
+def encode_json(obj) -> bytes:
+    """
+    Serialize command output as indented, newline-terminated UTF-8 JSON.
 
-def resolve_contact(cm: ContactsManager, name: str):
+    Uses orjson when installed; values JSON can't represent (datetimes
+    included) go through str(), exactly as with json.dumps(default=str).
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return (json.dumps(obj, indent=2, default=str) + "\n").encode()
+    option = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+              | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_APPEND_NEWLINE)
+    return orjson.dumps(obj, default=str, option=option)
+
+
+def write_json(obj) -> None:
+    """
+    Write command output to stdout as JSON (see encode_json).
+
+    The encoded bytes go straight to the binary buffer, skipping the
+    decode and re-encode that print() of a str would cost.
+    """
+    data = encode_json(obj)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # Captured by run_request (daemon)
+        sys.stdout.write(data.decode())
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+
+
+# Informational stderr notices ("Matched ...", "Sending to ...") are written
+# only for a person at a terminal or with --verbose, so output is
+# machine-friendly by default when another process drives the CLI. Errors
+# are always reported.
+_SHOW_NOTICES = sys.stderr.isatty()
+
+
+def notice(message: str) -> None:
+    """Print an informational message to stderr (see _SHOW_NOTICES)."""
+    if _SHOW_NOTICES:
+        print(message, file=sys.stderr)
+
+
+def write_lines(lines) -> None:
+    """
+    Write collected output lines to stdout in a single call.
+
+    The text is encoded once, with stdout's own encoding, and handed to
+    the binary buffer as one write.
+    """
+    if not lines:
+        return
+    text = "\n".join(lines) + "\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # Captured by run_request (daemon)
+        sys.stdout.write(text)
+        return
+    data = text.encode(sys.stdout.encoding or "utf-8", sys.stdout.errors or "strict")
+    sys.stdout.flush()
+    buffer.write(data)
+
+
+def resolve_contact(cm, name: str):
     """Resolve contact name to Contact object using fuzzy matching."""
     contact = cm.get_contact_by_name(name)
     # get_contact_by_name already does partial matching
     if contact and contact.name.lower() != name.lower():
-        print(f"Matched '{name}' to '{contact.name}'", file=sys.stderr)
+        notice(f"Matched '{name}' to '{contact.name}'")
     return contact
 
 
@@ -80,16 +278,19 @@ def cmd_find(args):
         messages = mi.get_messages_by_phone(contact.phone, limit=args.limit)
 
     if args.json:
-        print(json.dumps(messages, indent=2, default=str))
+        write_json(messages)
     else:
-        print(f"Messages with {contact.name} ({contact.phone}):")
-        print("-" * 60)
+        out = [f"Messages with {contact.name} ({contact.phone}):", "-" * 60]
 
+        # Message dicts always carry 'text' and 'is_from_me'
+        me_name, other_name = "Me", contact.name
+        default_text = '[media/attachment]'
         for m in messages:
-            sender = "Me" if m.get('is_from_me') else contact.name
-            text = m.get('text', '[media/attachment]') or '[media/attachment]'
+            sender = me_name if m['is_from_me'] else other_name
+            text = m['text'] or default_text
             timestamp = m.get('timestamp', '')
-            print(f"{timestamp} | {sender}: {text[:200]}")
+            out.append(f"{timestamp} | {sender}: {text[:200]}")
+        write_lines(out)
 
     return 0
 
@@ -103,66 +304,68 @@ def cmd_messages(args):
         print(f"Contact '{args.contact}' not found.", file=sys.stderr)
         return 1
 
-    messages = mi.get_messages_by_phone(contact.phone, limit=args.limit)
-
     if args.json:
-        print(json.dumps(messages, indent=2, default=str))
+        write_json(mi.get_messages_by_phone(contact.phone, limit=args.limit))
     else:
-        if not messages:
+        # Streamed: only the truncated line of each message is kept
+        out = []
+        me_name, other_name = "Me", contact.name
+        for m in mi.iter_messages_by_phone(contact.phone, limit=args.limit):
+            sender = me_name if m['is_from_me'] else other_name
+            text = m['text'] or '[media]'
+            out.append(f"{sender}: {text[:200]}")
+
+        if not out:
             print("No messages found.")
             return 0
-
-        for m in messages:
-            sender = "Me" if m.get('is_from_me') else contact.name
-            text = m.get('text', '[media]') or '[media]'
-            print(f"{sender}: {text[:200]}")
+        write_lines(out)
 
     return 0
 
 
 def cmd_recent(args):
     """Get recent conversations across all contacts."""
-    mi, _ = get_interfaces()
+    mi = get_messages_interface()
 
     conversations = mi.get_all_recent_conversations(limit=args.limit)
 
     if args.json:
-        print(json.dumps(conversations, indent=2, default=str))
+        write_json(conversations)
     else:
         if not conversations:
             print("No recent conversations found.")
             return 0
 
-        print("Recent Conversations:")
-        print("-" * 60)
+        out = ["Recent Conversations:", "-" * 60]
         for conv in conversations:
             handle = conv.get('handle_id', 'Unknown')
             last_msg = conv.get('last_message', '')[:80]
             timestamp = conv.get('last_message_date', '')
-            print(f"{handle}: {last_msg} ({timestamp})")
+            out.append(f"{handle}: {last_msg} ({timestamp})")
+        write_lines(out)
 
     return 0
 
 
 def cmd_unread(args):
     """Get unread messages."""
-    mi, _ = get_interfaces()
+    mi = get_messages_interface()
 
     messages = mi.get_unread_messages(limit=args.limit)
 
     if args.json:
-        print(json.dumps(messages, indent=2, default=str))
+        write_json(messages)
     else:
         if not messages:
             print("No unread messages.")
             return 0
 
-        print(f"Unread Messages ({len(messages)}):")
-        print("-" * 60)
+        out = [f"Unread Messages ({len(messages)}):", "-" * 60]
         for m in messages:
             sender = m.get('sender', 'Unknown')
             text = m.get('text', '[media]') or '[media]'
-            print(f"{sender}: {text[:150]}")
+            out.append(f"{sender}: {text[:150]}")
+        write_lines(out)
 
     return 0
 
@@ -178,11 +381,11 @@ def cmd_send(args):
 
     message = " ".join(args.message)
 
-    print(f"Sending to {contact.name} ({contact.phone}): {message[:50]}...", file=sys.stderr)
+    notice(f"Sending to {contact.name} ({contact.phone}): {message[:50]}...")
     result = mi.send_message(contact.phone, message)
 
     if result.get('success'):
-        print("Message sent successfully.", file=sys.stderr)
+        notice("Message sent successfully.")
         return 0
     else:
         print(f"Failed to send: {result.get('error', 'Unknown error')}", file=sys.stderr)
@@ -191,7 +394,9 @@ def cmd_send(args):
 
 def cmd_send_by_phone(args):
     """Send a message directly to a phone number (no contact lookup)."""
-    mi, _ = get_interfaces()
+    import json
+
+    mi = get_messages_interface()
 
     # Normalize phone number (strip formatting characters)
     phone = args.phone.strip().translate(str.maketrans('', '', ' ()-.'))
@@ -199,14 +404,14 @@ def cmd_send_by_phone(args):
 
     message = " ".join(args.message)
 
-    print(f"Sending to {phone}: {message[:50]}...", file=sys.stderr)
+    notice(f"Sending to {phone}: {message[:50]}...")
     result = mi.send_message(phone, message)
 
     if result.get('success'):
         if args.json:
             print(json.dumps({"success": True, "phone": phone, "message": message}))
         else:
-            print("Message sent successfully.", file=sys.stderr)
+            notice("Message sent successfully.")
         return 0
     else:
         error = result.get('error', 'Unknown error')
@@ -219,15 +424,17 @@ def cmd_send_by_phone(args):
 
 def cmd_contacts(args):
     """List all contacts."""
-    _, cm = get_interfaces()
+    from operator import methodcaller
+
+    cm = get_contacts_manager()
 
     if args.json:
-        print(json.dumps([c.to_dict() for c in cm.contacts], indent=2))
+        write_json(list(map(methodcaller('to_dict'), cm.contacts)))
     else:
-        print(f"Contacts ({len(cm.contacts)}):")
-        print("-" * 40)
+        out = [f"Contacts ({len(cm.contacts)}):", "-" * 40]
         for c in cm.contacts:
-            print(f"{c.name}: {c.phone}")
+            out.append(f"{c.name}: {c.phone}")
+        write_lines(out)
 
     return 0
 
@@ -246,12 +453,12 @@ def cmd_analytics(args):
         analytics = mi.get_conversation_analytics(days=args.days)
 
     if args.json:
-        print(json.dumps(analytics, indent=2, default=str))
+        write_json(analytics)
     else:
-        print("Conversation Analytics:")
-        print("-" * 40)
+        out = ["Conversation Analytics:", "-" * 40]
         for key, value in analytics.items():
-            print(f"{key}: {value}")
+            out.append(f"{key}: {value}")
+        write_lines(out)
 
     return 0
 
@@ -263,7 +470,7 @@ def cmd_followup(args):
     followups = mi.detect_follow_up_needed(days=args.days, min_stale_days=args.stale)
 
     if args.json:
-        print(json.dumps(followups, indent=2, default=str))
+        write_json(followups)
     else:
         # Check if there are any action items
         summary = followups.get("summary", {})
@@ -279,8 +486,7 @@ def cmd_followup(args):
             print("No follow-ups needed.")
             return 0
 
-        print("Follow-ups Needed:")
-        print("-" * 60)
+        out = ["Follow-ups Needed:", "-" * 60]
 
         # Iterate through categories (skip metadata keys)
         for category, items in followups.items():
@@ -289,14 +495,15 @@ def cmd_followup(args):
             if not items or not isinstance(items, list):
                 continue
 
-            print(f"\n--- {category.replace('_', ' ').title()} ---")
+            out.append(f"\n--- {category.replace('_', ' ').title()} ---")
             for item in items:
                 phone = item.get('phone')
                 contact = cm.get_contact_by_phone(phone) if phone else None
                 name = contact.name if contact else phone or "Unknown"
                 text = item.get('text') or item.get('last_message', '')
                 date = item.get('date', '')
-                print(f"  {name}: {text[:100]} ({date})")
+                out.append(f"  {name}: {text[:100]} ({date})")
+        write_lines(out)
 
     return 0
 
@@ -308,32 +515,32 @@ def cmd_followup(args):
 
 def cmd_groups(args):
     """List all group chats."""
-    mi, _ = get_interfaces()
+    mi = get_messages_interface()
 
     groups = mi.list_group_chats(limit=args.limit)
 
     if args.json:
-        print(json.dumps(groups, indent=2, default=str))
+        write_json(groups)
     else:
         if not groups:
             print("No group chats found.")
             return 0
 
-        print(f"Group Chats ({len(groups)}):")
-        print("-" * 60)
+        out = [f"Group Chats ({len(groups)}):", "-" * 60]
         for g in groups:
             name = g.get('display_name') or g.get('group_id', 'Unknown')
             participants = g.get('participant_count', 0)
             msg_count = g.get('message_count', 0)
-            print(f"{name} ({participants} members, {msg_count} messages)")
-            print(f"  ID: {g.get('group_id', 'N/A')}")
+            out.append(f"{name} ({participants} members, {msg_count} messages)")
+            out.append(f"  ID: {g.get('group_id', 'N/A')}")
+        write_lines(out)
 
     return 0
 
 
 def cmd_group_messages(args):
     """Get messages from a group chat."""
-    mi, _ = get_interfaces()
+    mi = get_messages_interface()
 
     if not args.group_id and not args.participant:
         print("Error: Must provide --group-id or --participant", file=sys.stderr)
@@ -346,19 +553,19 @@ def cmd_group_messages(args):
     )
 
     if args.json:
-        print(json.dumps(messages, indent=2, default=str))
+        write_json(messages)
     else:
         if not messages:
             print("No group messages found.")
             return 0
 
-        print(f"Group Messages ({len(messages)}):")
-        print("-" * 60)
+        out = [f"Group Messages ({len(messages)}):", "-" * 60]
         for m in messages:
             sender = "Me" if m.get('is_from_me') else m.get('sender_handle', 'Unknown')
             text = m.get('text', '[media]') or '[media]'
             date = m.get('date', '')
-            print(f"[{date}] {sender}: {text[:150]}")
+            out.append(f"[{date}] {sender}: {text[:150]}")
+        write_lines(out)
 
     return 0
 
@@ -382,28 +589,28 @@ def cmd_attachments(args):
     )
 
     if args.json:
-        print(json.dumps(attachments, indent=2, default=str))
+        write_json(attachments)
     else:
         if not attachments:
             print("No attachments found.")
             return 0
 
-        print(f"Attachments ({len(attachments)}):")
-        print("-" * 60)
+        out = [f"Attachments ({len(attachments)}):", "-" * 60]
         for a in attachments:
             filename = a.get('filename') or a.get('transfer_name', 'Unknown')
             mime = a.get('mime_type', 'unknown')
             size = a.get('total_bytes', 0)
             size_str = f"{size / 1024:.1f}KB" if size else "N/A"
             date = a.get('message_date', '')
-            print(f"{filename} ({mime}, {size_str}) - {date}")
+            out.append(f"{filename} ({mime}, {size_str}) - {date}")
+        write_lines(out)
 
     return 0
 
 
 def cmd_add_contact(args):
     """Add a new contact."""
-    _, cm = get_interfaces()
+    cm = get_contacts_manager()
 
     try:
         cm.add_contact(
@@ -439,20 +646,20 @@ def cmd_reactions(args):
     reactions = mi.get_reactions(phone=phone, limit=args.limit)
 
     if args.json:
-        print(json.dumps(reactions, indent=2, default=str))
+        write_json(reactions)
     else:
         if not reactions:
             print("No reactions found.")
             return 0
 
-        print(f"Reactions ({len(reactions)}):")
-        print("-" * 60)
+        out = [f"Reactions ({len(reactions)}):", "-" * 60]
         for r in reactions:
             emoji = r.get('reaction_emoji', '?')
             reactor = "Me" if r.get('is_from_me') else r.get('reactor_handle', 'Unknown')
             original = r.get('original_message_preview', '')[:50]
             date = r.get('date', '')
-            print(f"{emoji} by {reactor} on \"{original}...\" ({date})")
+            out.append(f"{emoji} by {reactor} on \"{original}...\" ({date})")
+        write_lines(out)
 
     return 0
 
@@ -473,20 +680,20 @@ def cmd_links(args):
     links = mi.extract_links(phone=phone, days=days, limit=args.limit)
 
     if args.json:
-        print(json.dumps(links, indent=2, default=str))
+        write_json(links)
     else:
         if not links:
             print("No links found.")
             return 0
 
-        print(f"Shared Links ({len(links)}):")
-        print("-" * 60)
+        out = [f"Shared Links ({len(links)}):", "-" * 60]
         for link in links:
             url = link.get('url', 'N/A')
             sender = "Me" if link.get('is_from_me') else link.get('sender_handle', 'Unknown')
             date = link.get('date', '')
-            print(f"{url}")
-            print(f"  From: {sender} ({date})")
+            out.append(f"{url}")
+            out.append(f"  From: {sender} ({date})")
+        write_lines(out)
 
     return 0
 
@@ -506,29 +713,29 @@ def cmd_voice(args):
     voice_msgs = mi.get_voice_messages(phone=phone, limit=args.limit)
 
     if args.json:
-        print(json.dumps(voice_msgs, indent=2, default=str))
+        write_json(voice_msgs)
     else:
         if not voice_msgs:
             print("No voice messages found.")
             return 0
 
-        print(f"Voice Messages ({len(voice_msgs)}):")
-        print("-" * 60)
+        out = [f"Voice Messages ({len(voice_msgs)}):", "-" * 60]
         for v in voice_msgs:
             path = v.get('attachment_path', 'N/A')
             sender = "Me" if v.get('is_from_me') else v.get('sender_handle', 'Unknown')
             size = v.get('size_bytes', 0)
             size_str = f"{size / 1024:.1f}KB" if size else "N/A"
             date = v.get('date', '')
-            print(f"{path}")
-            print(f"  From: {sender}, Size: {size_str}, Date: {date}")
+            out.append(f"{path}")
+            out.append(f"  From: {sender}, Size: {size_str}, Date: {date}")
+        write_lines(out)
 
     return 0
 
 
 def cmd_thread(args):
     """Get messages in a reply thread."""
-    mi, _ = get_interfaces()
+    mi = get_messages_interface()
 
     if not args.guid:
         print("Error: Must provide --guid for message thread", file=sys.stderr)
@@ -537,20 +744,20 @@ def cmd_thread(args):
     thread = mi.get_message_thread(message_guid=args.guid, limit=args.limit)
 
     if args.json:
-        print(json.dumps(thread, indent=2, default=str))
+        write_json(thread)
     else:
         if not thread:
             print("No thread messages found.")
             return 0
 
-        print(f"Thread Messages ({len(thread)}):")
-        print("-" * 60)
+        out = [f"Thread Messages ({len(thread)}):", "-" * 60]
         for m in thread:
             sender = "Me" if m.get('is_from_me') else m.get('sender_handle', 'Unknown')
             text = m.get('text', '[media]') or '[media]'
             date = m.get('date', '')
             is_originator = " [THREAD START]" if m.get('is_thread_originator') else ""
-            print(f"[{date}] {sender}: {text[:150]}{is_originator}")
+            out.append(f"[{date}] {sender}: {text[:150]}{is_originator}")
+        write_lines(out)
 
     return 0
 
@@ -562,33 +769,35 @@ def cmd_thread(args):
 
 def cmd_handles(args):
     """List all unique phone/email handles from recent messages."""
-    mi, _ = get_interfaces()
+    mi = get_messages_interface()
 
     handles = mi.list_recent_handles(days=args.days, limit=args.limit)
 
     if args.json:
-        print(json.dumps(handles, indent=2, default=str))
+        write_json(handles)
     else:
         if not handles:
             print("No handles found.")
             return 0
 
-        print(f"Recent Handles ({len(handles)}):")
-        print("-" * 60)
+        out = [f"Recent Handles ({len(handles)}):", "-" * 60]
         for h in handles:
             handle = h.get('handle', 'Unknown')
             msg_count = h.get('message_count', 0)
             last_date = h.get('last_message_date', '')
-            print(f"{handle} ({msg_count} messages, last: {last_date})")
+            out.append(f"{handle} ({msg_count} messages, last: {last_date})")
+        write_lines(out)
 
     return 0
 
 
 def cmd_unknown(args):
     """Find messages from senders not in contacts."""
+    from operator import attrgetter
+
     mi, cm = get_interfaces()
 
-    known_phones = [c.phone for c in cm.contacts]
+    known_phones = frozenset(map(attrgetter('phone'), cm.contacts))
     unknown = mi.search_unknown_senders(
         known_phones=known_phones,
         days=args.days,
@@ -596,50 +805,50 @@ def cmd_unknown(args):
     )
 
     if args.json:
-        print(json.dumps(unknown, indent=2, default=str))
+        write_json(unknown)
     else:
         if not unknown:
             print("No unknown senders found.")
             return 0
 
-        print(f"Unknown Senders ({len(unknown)}):")
-        print("-" * 60)
+        out = [f"Unknown Senders ({len(unknown)}):", "-" * 60]
         for u in unknown:
             handle = u.get('handle', 'Unknown')
             msg_count = u.get('message_count', 0)
             last_date = u.get('last_message_date', '')
-            print(f"{handle} ({msg_count} messages, last: {last_date})")
+            out.append(f"{handle} ({msg_count} messages, last: {last_date})")
             # Show sample messages if available
             messages = u.get('messages', [])
             for msg in messages[:2]:
-                text = msg.get('text', '')[:80] if msg.get('text') else '[media]'
-                print(f"  \"{text}\"")
+                text = msg.get('text')
+                out.append(f"  \"{text[:80] if text else '[media]'}\"")
+        write_lines(out)
 
     return 0
 
 
 def cmd_scheduled(args):
     """Get scheduled messages (pending sends)."""
-    mi, _ = get_interfaces()
+    mi = get_messages_interface()
 
     scheduled = mi.get_scheduled_messages()
 
     if args.json:
-        print(json.dumps(scheduled, indent=2, default=str))
+        write_json(scheduled)
     else:
         if not scheduled:
             print("No scheduled messages.")
             return 0
 
-        print(f"Scheduled Messages ({len(scheduled)}):")
-        print("-" * 60)
+        out = [f"Scheduled Messages ({len(scheduled)}):", "-" * 60]
         for s in scheduled:
             text = s.get('text', '[media]') or '[media]'
             recipient = s.get('recipient_handle', 'Unknown')
             sched_date = s.get('scheduled_date', 'N/A')
-            print(f"To: {recipient}")
-            print(f"  Message: {text[:100]}")
-            print(f"  Scheduled for: {sched_date}")
+            out.append(f"To: {recipient}")
+            out.append(f"  Message: {text[:100]}")
+            out.append(f"  Scheduled for: {sched_date}")
+        write_lines(out)
 
     return 0
 
@@ -660,23 +869,24 @@ def cmd_summary(args):
     )
 
     if args.json:
-        print(json.dumps(summary, indent=2, default=str))
+        write_json(summary)
     else:
-        print(f"Conversation Summary: {contact.name}")
-        print("-" * 60)
+        out = [f"Conversation Summary: {contact.name}", "-" * 60]
         stats = summary.get('key_stats', {})
-        print(f"Messages: {summary.get('message_count', 0)}")
-        print(f"Date range: {summary.get('date_range', 'N/A')}")
-        print(f"Last interaction: {summary.get('last_interaction', 'N/A')}")
+        out.append(f"Messages: {summary.get('message_count', 0)}")
+        out.append(f"Date range: {summary.get('date_range', 'N/A')}")
+        out.append(f"Last interaction: {summary.get('last_interaction', 'N/A')}")
         if stats:
-            print(f"Sent: {stats.get('sent', 0)}, Received: {stats.get('received', 0)}")
+            out.append(f"Sent: {stats.get('sent', 0)}, Received: {stats.get('received', 0)}")
         topics = summary.get('recent_topics', [])
         if topics:
-            print(f"Recent topics: {', '.join(topics[:5])}")
-        print("\n--- Conversation Text ---")
-        print(summary.get('conversation_text', '')[:2000])
-        if len(summary.get('conversation_text', '')) > 2000:
-            print("... (truncated, use --json for full output)")
+            out.append(f"Recent topics: {', '.join(topics[:5])}")
+        text = summary.get('conversation_text', '')
+        out.append("\n--- Conversation Text ---")
+        out.append(text[:2000])
+        if len(text) > 2000:
+            out.append("... (truncated, use --json for full output)")
+        write_lines(out)
 
     return 0
 
@@ -742,7 +952,7 @@ def cmd_index(args):
 
         if args.json:
             result['elapsed_seconds'] = elapsed
-            print(json.dumps(result, indent=2, default=str))
+            write_json(result)
         else:
             chunks_indexed = result.get('chunks_indexed', 0)
             chunks_found = result.get('chunks_found', chunks_indexed)
@@ -781,14 +991,13 @@ def cmd_search(args):
         )
 
         if args.json:
-            print(json.dumps(results, indent=2, default=str))
+            write_json(results)
         else:
             if not results:
                 print(f'No results found for: "{args.query}"')
                 return 0
 
-            print(f'Found {len(results)} result(s) for: "{args.query}"')
-            print("-" * 60)
+            out = [f'Found {len(results)} result(s) for: "{args.query}"', "-" * 60]
 
             for i, result in enumerate(results, 1):
                 score = result.get('score', 0) * 100
@@ -797,8 +1006,9 @@ def cmd_search(args):
                 timestamp = result.get('timestamp', '')[:10] if result.get('timestamp') else ''
                 text = result.get('text', '')[:200]
 
-                print(f"\n[{i}] [{source}] {title} | {timestamp} | {score:.0f}% match")
-                print(f"    {text}...")
+                out.append(f"\n[{i}] [{source}] {title} | {timestamp} | {score:.0f}% match")
+                out.append(f"    {text}...")
+            write_lines(out)
 
         return 0
 
@@ -825,7 +1035,7 @@ def cmd_ask(args):
         )
 
         if args.json:
-            print(json.dumps({"question": args.question, "context": context}, indent=2))
+            write_json({"question": args.question, "context": context})
         else:
             print(context)
 
@@ -843,7 +1053,7 @@ def cmd_stats(args):
         stats = retriever.get_stats(source=args.source)
 
         if args.json:
-            print(json.dumps(stats, indent=2, default=str))
+            write_json(stats)
         else:
             total = stats.get('total_chunks', 0)
             if total == 0:
@@ -855,21 +1065,24 @@ def cmd_stats(args):
                 print("  index --source=local         Index all local sources")
                 return 0
 
-            print("Knowledge Base Statistics")
-            print("=" * 40)
-            print(f"Total chunks indexed: {total}")
-            print(f"Unique participants: {stats.get('unique_participants', 0)}")
-            print(f"Unique tags: {stats.get('unique_tags', 0)}")
+            out = [
+                "Knowledge Base Statistics",
+                "=" * 40,
+                f"Total chunks indexed: {total}",
+                f"Unique participants: {stats.get('unique_participants', 0)}",
+                f"Unique tags: {stats.get('unique_tags', 0)}",
+            ]
 
             by_source = stats.get('by_source', {})
             if by_source:
-                print("\nBy Source:")
+                out.append("\nBy Source:")
                 for src, info in sorted(by_source.items()):
                     count = info.get('chunk_count', 0)
                     if count > 0:
                         oldest = info.get('oldest', 'N/A')[:10] if info.get('oldest') else 'N/A'
                         newest = info.get('newest', 'N/A')[:10] if info.get('newest') else 'N/A'
-                        print(f"  {src}: {count} chunks ({oldest} to {newest})")
+                        out.append(f"  {src}: {count} chunks ({oldest} to {newest})")
+            write_lines(out)
 
         return 0
 
@@ -898,9 +1111,13 @@ def cmd_clear(args):
             return 1
 
         deleted = retriever.clear(source=args.source)
+        if args.source in (None, 'imessage'):
+            # Its recorded watermark and chunk IDs describe the deleted chunks
+            from src.rag.unified.index_state import IndexState
+            IndexState().reset('imessage')
 
         if args.json:
-            print(json.dumps({"deleted_chunks": deleted, "source": args.source or "all"}, indent=2))
+            write_json({"deleted_chunks": deleted, "source": args.source or "all"})
         else:
             print(f"✓ Deleted {deleted} chunks")
 
@@ -930,18 +1147,18 @@ def cmd_sources(args):
                     for src in available
                 }
             }
-            print(json.dumps(result, indent=2))
+            write_json(result)
         else:
-            print("Available Sources:")
-            print("-" * 40)
+            out = ["Available Sources:", "-" * 40]
             for src in available:
                 count = by_source.get(src, {}).get('chunk_count', 0)
                 status = f"({count} chunks)" if count > 0 else "(not indexed)"
                 marker = "✓" if src in indexed else " "
-                print(f"  {marker} {src} {status}")
+                out.append(f"  {marker} {src} {status}")
 
-            print("\nTo index a source:")
-            print("  index --source=<source> [--days=30]")
+            out.append("\nTo index a source:")
+            out.append("  index --source=<source> [--days=30]")
+            write_lines(out)
 
         return 0
 
@@ -950,28 +1167,306 @@ def cmd_sources(args):
         return 1
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="iMessage Gateway - Standalone CLI for iMessage operations",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s find "Angus" --query "SF"       Find messages with Angus containing "SF"
-  %(prog)s messages "John" --limit 10      Get last 10 messages with John
-  %(prog)s recent                          Show recent conversations
-  %(prog)s unread                          Show unread messages
-  %(prog)s send "John" "Running late!"     Send message to John
-  %(prog)s send-by-phone +14155551234 "Hi" Send directly to phone number
-  %(prog)s contacts                        List all contacts
-  %(prog)s followup --days 7               Find messages needing follow-up
-  %(prog)s search "dinner plans"           Semantic search across indexed messages
-  %(prog)s index --source=imessage         Index iMessages for semantic search
-        """
-    )
+# Commands that start a resident loop; never dispatched from inside one
+RESIDENT_COMMANDS = ('daemon', 'repl')
 
-    subparsers = parser.add_subparsers(dest='command', help='Command to run')
 
-    # find command (keyword search in messages)
+def dispatch(parser, argv):
+    """Parse and run one CLI invocation in-process; returns its exit code."""
+    try:
+        args = parse_fast(argv) or parser.parse_args(argv)
+        if not args.command:
+            parser.print_help()
+            return 1
+        if args.command in RESIDENT_COMMANDS:
+            print(f"Error: {args.command} cannot run inside a resident process", file=sys.stderr)
+            return 1
+        return args.func(args) or 0
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+def serve(parser):
+    """
+    Resident request/response loop for benchmark drivers (repl / --serve).
+
+    Reads one JSON request per stdin line - an argv list such as
+    ["recent", "--limit", "10"], or {"cmd": [...]} - runs it with command
+    stdout discarded, and writes one JSON line back:
+    {"elapsed_ns": int, "elapsed_ms": float, "ok": bool, "rc": int}.
+    elapsed_ns is measured in-process around dispatch only, so it excludes
+    pipe latency. Interpreter startup and module imports are paid once for
+    the lifetime of the process.
+    """
+    import os
+    import json
+    import time
+    from contextlib import redirect_stdout
+
+    out = sys.stdout
+    out.write(json.dumps({"ready": True}) + "\n")
+    out.flush()
+
+    with open(os.devnull, 'w') as devnull:
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                request = None
+            argv = request.get("cmd") if isinstance(request, dict) else request
+
+            start = time.perf_counter_ns()
+            if isinstance(argv, list):
+                with redirect_stdout(devnull):
+                    rc = dispatch(parser, argv)
+            else:
+                rc = 1
+            elapsed_ns = time.perf_counter_ns() - start
+
+            out.write(json.dumps({
+                "elapsed_ns": elapsed_ns,
+                "elapsed_ms": elapsed_ns / 1e6,
+                "ok": rc == 0,
+                "rc": rc
+            }) + "\n")
+            out.flush()
+
+    return 0
+
+
+def cmd_repl(args):
+    """Serve JSON command lines on stdin/stdout (see serve())."""
+    return serve(build_parser())
+
+
+def _recv_exact(conn, n):
+    """Read exactly n bytes from a socket (b'' if the peer closed early)."""
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = conn.recv(n - len(buf))
+        if not chunk:
+            return b''
+        buf += chunk
+    return bytes(buf)
+
+
+def recv_frame(conn):
+    """Read one length-prefixed (4-byte big-endian) JSON frame, or None on EOF."""
+    import json
+
+    header = _recv_exact(conn, 4)
+    if not header:
+        return None
+    body = _recv_exact(conn, int.from_bytes(header, 'big'))
+    return json.loads(body) if body else None
+
+
+def send_frame(conn, obj):
+    """Write one length-prefixed JSON frame."""
+    import json
+
+    body = json.dumps(obj).encode('utf-8')
+    conn.sendall(len(body).to_bytes(4, 'big') + body)
+
+
+def run_request(parser, argv):
+    """
+    Run one CLI invocation in-process, capturing its output.
+
+    Returns {"stdout": str, "stderr": str, "rc": int}.
+    """
+    import io
+    from contextlib import redirect_stdout, redirect_stderr
+
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        rc = dispatch(parser, argv)
+
+    return {"stdout": out.getvalue(), "stderr": err.getvalue(), "rc": rc}
+
+
+def _serve_connections(server, parser):
+    """Accept and answer daemon requests on a listening socket, forever."""
+    while True:
+        conn, _ = server.accept()
+        with conn:
+            try:
+                request = recv_frame(conn)
+                if request is None:
+                    continue
+
+                argv = [request["cmd"], *request.get("args", [])]
+                send_frame(conn, run_request(parser, argv))
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(f"Bad request: {e}", file=sys.stderr)
+
+
+def _spawn_worker(server, parser):
+    """Fork a worker that inherits the warmed interpreter and serves the socket."""
+    import os
+    import signal
+    import traceback
+
+    pid = os.fork()
+    if pid:
+        return pid
+
+    # Worker: the parent owns shutdown and socket cleanup
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        _serve_connections(server, parser)
+    except Exception:
+        traceback.print_exc()
+    finally:
+        os._exit(1)
+
+
+def cmd_daemon(args):
+    """
+    Serve CLI invocations over a Unix socket (see gateway/imessage_client_fast.py).
+
+    Imports, MessagesInterface and the parsed contacts are paid for once;
+    each request is a length-prefixed JSON frame {"cmd": str, "args": [str]}
+    answered with {"stdout": str, "stderr": str, "rc": int}.
+
+    With --workers N > 0, N pre-forked workers share the listening socket so
+    requests run in parallel, each in a copy-on-write clone of the warmed
+    process; dead workers are respawned. MessagesInterface opens a fresh
+    SQLite connection per query, so no connection ever crosses a fork.
+    """
+    import os
+    import signal
+    import socket
+
+    get_interfaces()  # Loaded once here, inherited by every forked worker
+    parser = build_parser()
+
+    sock_path = Path(args.socket).expanduser()
+    sock_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        sock_path.unlink()
+    except FileNotFoundError:
+        pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # Socket gives access to messages: owner only
+    try:
+        server.bind(str(sock_path))
+    finally:
+        os.umask(old_umask)
+    server.listen(64)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))  # Clean up socket on kill
+
+    workers = set()
+    try:
+        if args.workers <= 0:
+            print(f"Listening on {sock_path}", file=sys.stderr)
+            _serve_connections(server, parser)
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        for _ in range(args.workers):
+            workers.add(_spawn_worker(server, parser))
+        print(f"Listening on {sock_path} ({args.workers} workers)", file=sys.stderr)
+
+        while True:
+            pid, _ = os.wait()
+            if pid in workers:
+                workers.discard(pid)
+                workers.add(_spawn_worker(server, parser))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+        server.close()
+        try:
+            sock_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    return 0
+
+
+# Hot-path commands whose flags are simple enough to parse without argparse:
+# command -> (handler, default --limit, or None if the command takes no --limit)
+FAST_COMMANDS = {
+    'contacts': (cmd_contacts, None),
+    'recent': (cmd_recent, 10),
+    'unread': (cmd_unread, 20),
+    'groups': (cmd_groups, 50),
+    'scheduled': (cmd_scheduled, None),
+}
+
+
+def _parse_limit(value):
+    """Validate a --limit value as argparse would (1-500), else None."""
+    if value.isascii() and value.isdigit() and 1 <= int(value) <= 500:
+        return int(value)
+    return None
+
+
+def parse_fast(argv):
+    """
+    Parse simple FAST_COMMANDS invocations without importing argparse.
+
+    Accepts only --json and --limit N / -l N / --limit=N / -lN (1-500).
+    Returns an argparse-style namespace, or None so anything else falls
+    through to the full parser (which owns --help, validation errors, and
+    every other command).
+    """
+    if not argv or argv[0] not in FAST_COMMANDS:
+        return None
+
+    func, default_limit = FAST_COMMANDS[argv[0]]
+    args = SimpleNamespace(command=argv[0], func=func, json=False, serve=False)
+    if default_limit is not None:
+        args.limit = default_limit
+
+    rest = iter(argv[1:])
+    for token in rest:
+        if token == '--json':
+            args.json = True
+            continue
+        if default_limit is None:
+            return None
+
+        if token in ('--limit', '-l'):
+            value = next(rest, '')
+        elif token.startswith('--limit='):
+            value = token[8:]
+        elif token.startswith('-l') and token[2:3].isdigit():
+            value = token[2:]
+        else:
+            return None
+
+        limit = _parse_limit(value)
+        if limit is None:
+            return None
+        args.limit = limit
+
+    return args
+
+
+# =============================================================================
+# COMMAND PARSERS - one argparse subparser factory per command (see build_parser)
+# =============================================================================
+
+# find command (keyword search in messages)
+def _add_find_parser(subparsers):
     p_find = subparsers.add_parser('find', help='Find messages with a contact (keyword search)')
     p_find.add_argument('contact', help='Contact name (fuzzy matched)')
     p_find.add_argument('--query', '-q', help='Text to search for in messages')
@@ -980,7 +1475,9 @@ Examples:
     p_find.add_argument('--json', action='store_true', help='Output as JSON')
     p_find.set_defaults(func=cmd_find)
 
-    # messages command
+
+# messages command
+def _add_messages_parser(subparsers):
     p_messages = subparsers.add_parser('messages', help='Get messages with a contact')
     p_messages.add_argument('contact', help='Contact name')
     p_messages.add_argument('--limit', '-l', type=int, default=20, choices=range(1, 501), metavar='N',
@@ -988,39 +1485,51 @@ Examples:
     p_messages.add_argument('--json', action='store_true', help='Output as JSON')
     p_messages.set_defaults(func=cmd_messages)
 
-    # recent command
+
+# recent command
+def _add_recent_parser(subparsers):
     p_recent = subparsers.add_parser('recent', help='Get recent conversations')
     p_recent.add_argument('--limit', '-l', type=int, default=10, choices=range(1, 501), metavar='N',
                           help='Max conversations (1-500, default: 10)')
     p_recent.add_argument('--json', action='store_true', help='Output as JSON')
     p_recent.set_defaults(func=cmd_recent)
 
-    # unread command
+
+# unread command
+def _add_unread_parser(subparsers):
     p_unread = subparsers.add_parser('unread', help='Get unread messages')
     p_unread.add_argument('--limit', '-l', type=int, default=20, choices=range(1, 501), metavar='N',
                           help='Max messages (1-500, default: 20)')
     p_unread.add_argument('--json', action='store_true', help='Output as JSON')
     p_unread.set_defaults(func=cmd_unread)
 
-    # send command
+
+# send command
+def _add_send_parser(subparsers):
     p_send = subparsers.add_parser('send', help='Send a message')
     p_send.add_argument('contact', help='Contact name')
     p_send.add_argument('message', nargs='+', help='Message to send')
     p_send.set_defaults(func=cmd_send)
 
-    # send-by-phone command
+
+# send-by-phone command
+def _add_send_by_phone_parser(subparsers):
     p_send_phone = subparsers.add_parser('send-by-phone', help='Send message directly to phone number')
     p_send_phone.add_argument('phone', help='Phone number (e.g., +14155551234)')
     p_send_phone.add_argument('message', nargs='+', help='Message to send')
     p_send_phone.add_argument('--json', action='store_true', help='Output as JSON')
     p_send_phone.set_defaults(func=cmd_send_by_phone)
 
-    # contacts command
+
+# contacts command
+def _add_contacts_parser(subparsers):
     p_contacts = subparsers.add_parser('contacts', help='List all contacts')
     p_contacts.add_argument('--json', action='store_true', help='Output as JSON')
     p_contacts.set_defaults(func=cmd_contacts)
 
-    # analytics command
+
+# analytics command
+def _add_analytics_parser(subparsers):
     p_analytics = subparsers.add_parser('analytics', help='Get conversation analytics')
     p_analytics.add_argument('contact', nargs='?', help='Contact name (optional)')
     p_analytics.add_argument('--days', '-d', type=int, default=30, choices=range(1, 366), metavar='N',
@@ -1028,7 +1537,9 @@ Examples:
     p_analytics.add_argument('--json', action='store_true', help='Output as JSON')
     p_analytics.set_defaults(func=cmd_analytics)
 
-    # followup command
+
+# followup command
+def _add_followup_parser(subparsers):
     p_followup = subparsers.add_parser('followup', help='Detect messages needing follow-up')
     p_followup.add_argument('--days', '-d', type=int, default=7, choices=range(1, 366), metavar='N',
                             help='Days to look back (1-365, default: 7)')
@@ -1037,18 +1548,22 @@ Examples:
     p_followup.add_argument('--json', action='store_true', help='Output as JSON')
     p_followup.set_defaults(func=cmd_followup)
 
-    # =========================================================================
-    # T0 COMMANDS - Core Features
-    # =========================================================================
 
-    # groups command
+# =============================================================================
+# T0 COMMANDS - Core Features
+# =============================================================================
+
+# groups command
+def _add_groups_parser(subparsers):
     p_groups = subparsers.add_parser('groups', help='List all group chats')
     p_groups.add_argument('--limit', '-l', type=int, default=50, choices=range(1, 501), metavar='N',
                           help='Max groups to return (1-500, default: 50)')
     p_groups.add_argument('--json', action='store_true', help='Output as JSON')
     p_groups.set_defaults(func=cmd_groups)
 
-    # group-messages command
+
+# group-messages command
+def _add_group_messages_parser(subparsers):
     p_group_msg = subparsers.add_parser('group-messages', help='Get messages from a group chat')
     p_group_msg.add_argument('--group-id', '-g', dest='group_id', help='Group chat ID')
     p_group_msg.add_argument('--participant', '-p', help='Filter by participant phone/email')
@@ -1057,7 +1572,9 @@ Examples:
     p_group_msg.add_argument('--json', action='store_true', help='Output as JSON')
     p_group_msg.set_defaults(func=cmd_group_messages)
 
-    # attachments command
+
+# attachments command
+def _add_attachments_parser(subparsers):
     p_attach = subparsers.add_parser('attachments', help='Get attachments (photos, videos, files)')
     p_attach.add_argument('contact', nargs='?', help='Contact name (optional)')
     p_attach.add_argument('--type', '-t', help='MIME type filter (e.g., "image/", "video/")')
@@ -1066,7 +1583,9 @@ Examples:
     p_attach.add_argument('--json', action='store_true', help='Output as JSON')
     p_attach.set_defaults(func=cmd_attachments)
 
-    # add-contact command
+
+# add-contact command
+def _add_add_contact_parser(subparsers):
     p_add = subparsers.add_parser('add-contact', help='Add a new contact')
     p_add.add_argument('name', help='Contact name')
     p_add.add_argument('phone', help='Phone number (e.g., +14155551234 or +1-415-555-1234)')
@@ -1076,11 +1595,13 @@ Examples:
     p_add.add_argument('--notes', '-n', help='Notes about the contact')
     p_add.set_defaults(func=cmd_add_contact)
 
-    # =========================================================================
-    # T1 COMMANDS - Advanced Features
-    # =========================================================================
 
-    # reactions command
+# =============================================================================
+# T1 COMMANDS - Advanced Features
+# =============================================================================
+
+# reactions command
+def _add_reactions_parser(subparsers):
     p_react = subparsers.add_parser('reactions', help='Get reactions (tapbacks) from messages')
     p_react.add_argument('contact', nargs='?', help='Contact name (optional)')
     p_react.add_argument('--limit', '-l', type=int, default=100, choices=range(1, 501), metavar='N',
@@ -1088,7 +1609,9 @@ Examples:
     p_react.add_argument('--json', action='store_true', help='Output as JSON')
     p_react.set_defaults(func=cmd_reactions)
 
-    # links command
+
+# links command
+def _add_links_parser(subparsers):
     p_links = subparsers.add_parser('links', help='Extract URLs shared in conversations')
     p_links.add_argument('contact', nargs='?', help='Contact name (optional)')
     p_links.add_argument('--days', '-d', type=int, choices=range(1, 366), metavar='N',
@@ -1100,7 +1623,9 @@ Examples:
     p_links.add_argument('--json', action='store_true', help='Output as JSON')
     p_links.set_defaults(func=cmd_links)
 
-    # voice command
+
+# voice command
+def _add_voice_parser(subparsers):
     p_voice = subparsers.add_parser('voice', help='Get voice messages with file paths')
     p_voice.add_argument('contact', nargs='?', help='Contact name (optional)')
     p_voice.add_argument('--limit', '-l', type=int, default=50, choices=range(1, 501), metavar='N',
@@ -1108,7 +1633,9 @@ Examples:
     p_voice.add_argument('--json', action='store_true', help='Output as JSON')
     p_voice.set_defaults(func=cmd_voice)
 
-    # thread command
+
+# thread command
+def _add_thread_parser(subparsers):
     p_thread = subparsers.add_parser('thread', help='Get messages in a reply thread')
     p_thread.add_argument('--guid', '-g', required=True, help='Message GUID to get thread for')
     p_thread.add_argument('--limit', '-l', type=int, default=50, choices=range(1, 501), metavar='N',
@@ -1116,11 +1643,13 @@ Examples:
     p_thread.add_argument('--json', action='store_true', help='Output as JSON')
     p_thread.set_defaults(func=cmd_thread)
 
-    # =========================================================================
-    # T2 COMMANDS - Discovery Features
-    # =========================================================================
 
-    # handles command
+# =============================================================================
+# T2 COMMANDS - Discovery Features
+# =============================================================================
+
+# handles command
+def _add_handles_parser(subparsers):
     p_handles = subparsers.add_parser('handles', help='List all phone/email handles from recent messages')
     p_handles.add_argument('--days', '-d', type=int, default=30, choices=range(1, 366), metavar='N',
                            help='Days to look back (1-365, default: 30)')
@@ -1129,7 +1658,9 @@ Examples:
     p_handles.add_argument('--json', action='store_true', help='Output as JSON')
     p_handles.set_defaults(func=cmd_handles)
 
-    # unknown command
+
+# unknown command
+def _add_unknown_parser(subparsers):
     p_unknown = subparsers.add_parser('unknown', help='Find messages from senders not in contacts')
     p_unknown.add_argument('--days', '-d', type=int, default=30, choices=range(1, 366), metavar='N',
                            help='Days to look back (1-365, default: 30)')
@@ -1138,12 +1669,16 @@ Examples:
     p_unknown.add_argument('--json', action='store_true', help='Output as JSON')
     p_unknown.set_defaults(func=cmd_unknown)
 
-    # scheduled command
+
+# scheduled command
+def _add_scheduled_parser(subparsers):
     p_sched = subparsers.add_parser('scheduled', help='Get scheduled messages (pending sends)')
     p_sched.add_argument('--json', action='store_true', help='Output as JSON')
     p_sched.set_defaults(func=cmd_scheduled)
 
-    # summary command
+
+# summary command
+def _add_summary_parser(subparsers):
     p_summary = subparsers.add_parser('summary', help='Get conversation formatted for AI summarization')
     p_summary.add_argument('contact', help='Contact name')
     p_summary.add_argument('--days', '-d', type=int, choices=range(1, 366), metavar='N',
@@ -1153,11 +1688,13 @@ Examples:
     p_summary.add_argument('--json', action='store_true', help='Output as JSON')
     p_summary.set_defaults(func=cmd_summary)
 
-    # =========================================================================
-    # RAG COMMANDS - Semantic Search & Knowledge Base
-    # =========================================================================
 
-    # index command
+# =============================================================================
+# RAG COMMANDS - Semantic Search & Knowledge Base
+# =============================================================================
+
+# index command
+def _add_index_parser(subparsers):
     p_index = subparsers.add_parser('index', help='Index content for semantic search')
     p_index.add_argument('--source', '-s', required=True,
                          choices=VALID_RAG_SOURCES,
@@ -1173,7 +1710,9 @@ Examples:
     p_index.add_argument('--json', action='store_true', help='Output as JSON')
     p_index.set_defaults(func=cmd_index)
 
-    # search command (semantic search)
+
+# search command (semantic search)
+def _add_search_parser(subparsers):
     p_search = subparsers.add_parser('search', help='Semantic search across indexed content')
     p_search.add_argument('query', help='Search query')
     p_search.add_argument('--sources', help='Comma-separated sources to search (default: all)')
@@ -1184,7 +1723,9 @@ Examples:
     p_search.add_argument('--json', action='store_true', help='Output as JSON')
     p_search.set_defaults(func=cmd_search)
 
-    # ask command (formatted context for AI)
+
+# ask command (formatted context for AI)
+def _add_ask_parser(subparsers):
     p_ask = subparsers.add_parser('ask', help='Get AI-formatted context from knowledge base')
     p_ask.add_argument('question', help='Question to answer')
     p_ask.add_argument('--sources', help='Comma-separated sources to search (default: all)')
@@ -1195,13 +1736,17 @@ Examples:
     p_ask.add_argument('--json', action='store_true', help='Output as JSON')
     p_ask.set_defaults(func=cmd_ask)
 
-    # stats command
+
+# stats command
+def _add_stats_parser(subparsers):
     p_stats = subparsers.add_parser('stats', help='Show knowledge base statistics')
     p_stats.add_argument('--source', '-s', help='Show stats for specific source')
     p_stats.add_argument('--json', action='store_true', help='Output as JSON')
     p_stats.set_defaults(func=cmd_stats)
 
-    # clear command
+
+# clear command
+def _add_clear_parser(subparsers):
     p_clear = subparsers.add_parser('clear', help='Clear indexed data')
     p_clear.add_argument('--source', '-s', help='Clear only this source (default: all)')
     p_clear.add_argument('--force', '-f', action='store_true',
@@ -1209,12 +1754,136 @@ Examples:
     p_clear.add_argument('--json', action='store_true', help='Output as JSON')
     p_clear.set_defaults(func=cmd_clear)
 
-    # sources command
+
+# sources command
+def _add_sources_parser(subparsers):
     p_sources = subparsers.add_parser('sources', help='List available and indexed sources')
     p_sources.add_argument('--json', action='store_true', help='Output as JSON')
     p_sources.set_defaults(func=cmd_sources)
 
-    args = parser.parse_args()
+
+# repl command
+def _add_repl_parser(subparsers):
+    p_repl = subparsers.add_parser('repl', help='Run JSON command lines from stdin (used by gateway/benchmarks.py)')
+    p_repl.set_defaults(func=cmd_repl)
+
+
+# daemon command
+def _add_daemon_parser(subparsers):
+    import os
+
+    p_daemon = subparsers.add_parser('daemon', help='Serve commands over a Unix socket for fast repeat calls')
+    p_daemon.add_argument('--socket', default=os.environ.get(DAEMON_SOCKET_ENV, str(DAEMON_SOCKET)),
+                          help=f'Socket path (default: ${DAEMON_SOCKET_ENV} or {DAEMON_SOCKET})')
+    p_daemon.add_argument('--workers', '-w', type=int, default=os.cpu_count() or 1, metavar='N',
+                          help='Pre-forked worker processes (0 = serve in-process, default: CPU count)')
+    p_daemon.set_defaults(func=cmd_daemon)
+
+
+# Subparser factories by command name (see build_parser)
+COMMAND_PARSERS = {
+    'find': _add_find_parser,
+    'messages': _add_messages_parser,
+    'recent': _add_recent_parser,
+    'unread': _add_unread_parser,
+    'send': _add_send_parser,
+    'send-by-phone': _add_send_by_phone_parser,
+    'contacts': _add_contacts_parser,
+    'analytics': _add_analytics_parser,
+    'followup': _add_followup_parser,
+    'groups': _add_groups_parser,
+    'group-messages': _add_group_messages_parser,
+    'attachments': _add_attachments_parser,
+    'add-contact': _add_add_contact_parser,
+    'reactions': _add_reactions_parser,
+    'links': _add_links_parser,
+    'voice': _add_voice_parser,
+    'thread': _add_thread_parser,
+    'handles': _add_handles_parser,
+    'unknown': _add_unknown_parser,
+    'scheduled': _add_scheduled_parser,
+    'summary': _add_summary_parser,
+    'index': _add_index_parser,
+    'search': _add_search_parser,
+    'ask': _add_ask_parser,
+    'stats': _add_stats_parser,
+    'clear': _add_clear_parser,
+    'sources': _add_sources_parser,
+    'repl': _add_repl_parser,
+    'daemon': _add_daemon_parser,
+}
+
+
+def build_parser(command=None):
+    """
+    Build the argparse parser.
+
+    Given a known command name, only that command's subparser is added, so
+    a one-shot run doesn't construct all of them. Otherwise (errors, repl
+    and daemon dispatch) every command is registered.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="iMessage Gateway - Standalone CLI for iMessage operations",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s find "Angus" --query "SF"       Find messages with Angus containing "SF"
+  %(prog)s messages "John" --limit 10      Get last 10 messages with John
+  %(prog)s recent                          Show recent conversations
+  %(prog)s unread                          Show unread messages
+  %(prog)s send "John" "Running late!"     Send message to John
+  %(prog)s send-by-phone +14155551234 "Hi" Send directly to phone number
+  %(prog)s contacts                        List all contacts
+  %(prog)s followup --days 7               Find messages needing follow-up
+  %(prog)s search "dinner plans"           Semantic search across indexed messages
+  %(prog)s index --source=imessage         Index iMessages for semantic search
+        """
+    )
+
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Print informational notices to stderr even when it is not a terminal')
+    parser.add_argument('--serve', action='store_true',
+                        help='Same as the repl command')
+
+    subparsers = parser.add_subparsers(dest='command', help='Command to run')
+    if command in COMMAND_PARSERS:
+        COMMAND_PARSERS[command](subparsers)
+        # Top-level errors (e.g. unrecognized arguments) print the usage line
+        # listing every command; report them through the full parser
+        parser.error = lambda message: build_parser().error(message)
+    else:
+        for add_parser in COMMAND_PARSERS.values():
+            add_parser(subparsers)
+
+    return parser
+
+
+def main():
+    args = parse_fast(sys.argv[1:])
+    if args is not None:
+        return args.func(args)
+
+    # Global options take no values, so the first non-option is the command.
+    # Top-level help and --serve need every command.
+    argv = sys.argv[1:]
+    command = None
+    for arg in argv:
+        if arg in ('-h', '--help', '--serve'):
+            break
+        if not arg.startswith('-'):
+            command = arg
+            break
+    parser = build_parser(command)
+    args = parser.parse_args(argv)
+
+    if args.verbose:
+        global _SHOW_NOTICES
+        _SHOW_NOTICES = True
+
+    if args.serve:
+        return serve(parser)
 
     if not args.command:
         parser.print_help()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+iMessage Gateway fast client - forwards argv to a running `imessage_client.py daemon`.
+
+Imports nothing beyond the standard library, so a call costs interpreter
+startup plus one socket round trip. Falls back to the full CLI when no
+daemon is listening. Both sides use $IMESSAGE_GATEWAY_SOCKET as the socket
+path when it is set.
+
+Usage:
+    python3 gateway/imessage_client.py daemon &
+    python3 gateway/imessage_client_fast.py recent --limit 10
+"""
+
+import json
+import os
+import socket
+import sys
+
+SOCKET_PATH = os.environ.get(
+    "IMESSAGE_GATEWAY_SOCKET",
+    os.path.join(os.path.expanduser("~"), ".cache", "imessage-gateway.sock"),
+)
+FULL_CLI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "imessage_client.py")
+
+
+def _recv_exact(conn, n):
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = conn.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("daemon closed the connection")
+        buf += chunk
+    return bytes(buf)
+
+
+def main(argv):
+    if not argv:
+        os.execv(sys.executable, [sys.executable, FULL_CLI])
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        try:
+            conn.connect(SOCKET_PATH)
+        except (FileNotFoundError, ConnectionRefusedError):
+            # No daemon listening: nothing has run yet, so the full CLI can
+            os.execv(sys.executable, [sys.executable, FULL_CLI, *argv])
+
+        # From here on the daemon may already have run the command (a
+        # send, say), so a dropped connection is reported, never retried
+        try:
+            body = json.dumps({"cmd": argv[0], "args": argv[1:]}).encode("utf-8")
+            conn.sendall(len(body).to_bytes(4, "big") + body)
+            size = int.from_bytes(_recv_exact(conn, 4), "big")
+            response = json.loads(_recv_exact(conn, size))
+        except (OSError, ValueError) as e:
+            sys.stderr.write(f"Error: lost connection to daemon: {e}\n")
+            return 1
+
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    return response["rc"]
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Put the repo root on sys.path at interpreter startup via a .pth file.
+
+With imessage_mcp.pth installed in site-packages, `import src...` resolves
+without imessage_client.py inserting the repo root into sys.path itself
+on every start.
+
+The repo root then is on sys.path for every program run by that
+interpreter, exposing generic top-level names (src, tests, benchmarks, scripts) that
+can shadow other projects' modules. Installing is therefore refused outside
+a virtual environment unless --force is given.
+
+Usage:
+    python3 gateway/install_pth.py              # Install for this venv's interpreter
+    python3 gateway/install_pth.py --force      # Install outside a venv anyway
+    python3 gateway/install_pth.py --uninstall
+"""
+
+import argparse
+import sys
+import sysconfig
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PTH_NAME = "imessage_mcp.pth"
+
+
+def pth_path() -> Path:
+    """Location of the .pth file in this interpreter's site-packages."""
+    return Path(sysconfig.get_paths()["purelib"]) / PTH_NAME
+
+
+def main():
+    parser = argparse.ArgumentParser(description=f"Install {PTH_NAME} for {sys.executable}")
+    parser.add_argument(
+        "--uninstall",
+        action="store_true",
+        help=f"Remove {PTH_NAME} instead of writing it"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Install even when this interpreter isn't a virtual environment"
+    )
+    args = parser.parse_args()
+
+    if not args.uninstall and not args.force and sys.prefix == sys.base_prefix:
+        print(
+            f"Error: {sys.executable} is not a virtual environment. {PTH_NAME} would "
+            f"put {REPO_ROOT} (with its src, tests, benchmarks and scripts packages) on sys.path "
+            "for every program it runs. Use a venv, or pass --force.",
+            file=sys.stderr
+        )
+        return 1
+
+    path = pth_path()
+    try:
+        if args.uninstall:
+            path.unlink(missing_ok=True)
+            print(f"Removed {path}")
+        else:
+            path.write_text(f"{REPO_ROOT}\n")
+            print(f"Wrote {path} -> {REPO_ROOT}")
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,11 @@
+"""
+Python version compatibility shims.
+
+The project supports Python 3.9+; features from newer releases are gated here.
+"""
+
+import sys
+
+# dataclass(slots=True) arrived in Python 3.10. Slotted instances carry no
+# per-instance __dict__, which matters for classes built in large numbers.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -7,11 +7,28 @@ Sprint 2: macOS Contacts sync, fuzzy matching, DB integration
 
 import json
 import logging
+import mmap
+import os
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Config files at least this large are parsed straight from a memory map
+# rather than read into a bytes copy first
+MMAP_THRESHOLD = 64 * 1024
+
+
+def _phone_digits(phone: str) -> str:
+    """Normalize a phone number for comparison (digits only)."""
+    return ''.join(c for c in phone if c.isdigit())
+
 
 class Contact:
     """Represents a contact with messaging information."""
@@ -48,16 +65,66 @@ class ContactsManager:
     Sprint 2: Sync with macOS Contacts and Life Planner database
     """
 
-    def __init__(self, config_path: str = "config/contacts.json"):
+    def __init__(
+        self,
+        config_path: str = "config/contacts.json",
+        contacts_data: Optional[List[Dict]] = None
+    ):
         """
         Initialize contacts manager.
 
         Args:
             config_path: Path to contacts configuration file
+            contacts_data: Already-parsed "contacts" entries (e.g. from a
+                cache); when given, config_path is not read
         """
         self.config_path = Path(config_path)
         self.contacts: List[Contact] = []
-        self._load_contacts()
+        if contacts_data is None:
+            self._load_contacts()
+        else:
+            self.contacts = self._build_contacts(contacts_data)
+        self._build_indexes()
+
+    @staticmethod
+    def _build_contacts(contacts_data: List[Dict]) -> List[Contact]:
+        """Build Contact objects from "contacts" config entries."""
+        return [
+            Contact(
+                name=c["name"],
+                phone=c["phone"],
+                relationship_type=c.get("relationship_type", "other"),
+                notes=c.get("notes", "")
+            )
+            for c in contacts_data
+        ]
+
+    def _build_indexes(self):
+        """
+        Build lookup indexes over self.contacts.
+
+        Each index keeps the earliest list position per key, so lookups
+        return the same contact the original first-match scans did.
+        """
+        self._name_index: Dict[str, Contact] = {}
+        self._names_lower: List[str] = []  # parallel to self.contacts
+        self._phone_exact: Dict[str, int] = {}  # digits -> position
+        self._phone_suffix: Dict[str, int] = {}  # every digits suffix -> position
+        self._phone_lookups: Dict[str, Optional[int]] = {}  # raw query -> position
+        for position, contact in enumerate(self.contacts):
+            self._index_contact(position, contact)
+
+    def _index_contact(self, position: int, contact: Contact):
+        """Add one contact (at list position) to the lookup indexes."""
+        # A new contact can match phones that previously found nothing
+        self._phone_lookups.clear()
+        name_lower = contact.name.lower()
+        self._name_index.setdefault(name_lower, contact)
+        self._names_lower.append(name_lower)
+        digits = _phone_digits(contact.phone)
+        self._phone_exact.setdefault(digits, position)
+        for i in range(len(digits) + 1):
+            self._phone_suffix.setdefault(digits[i:], position)
 
     def _load_contacts(self):
         """Load contacts from configuration file."""
@@ -68,19 +135,9 @@ class ContactsManager:
             return
 
         try:
-            with open(self.config_path) as f:
-                data = json.load(f)
-
-            contacts_data = data.get("contacts", [])
-            self.contacts = [
-                Contact(
-                    name=c["name"],
-                    phone=c["phone"],
-                    relationship_type=c.get("relationship_type", "other"),
-                    notes=c.get("notes", "")
-                )
-                for c in contacts_data
-            ]
+            data = self._read_config()
+
+            self.contacts = self._build_contacts(data.get("contacts", []))
 
             logger.info(f"Loaded {len(self.contacts)} contacts from config")
 
@@ -88,6 +145,17 @@ class ContactsManager:
             logger.error(f"Error loading contacts: {e}")
             self.contacts = []
 
+    def _read_config(self) -> dict:
+        """Parse the configuration file (orjson when available, stdlib json otherwise)."""
+        with open(self.config_path, 'rb') as f:
+            if not ORJSON_AVAILABLE:
+                return json.load(f)
+            if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as buf:
+                    return orjson.loads(buf)
+
     def _create_default_config(self):
         """Create default contacts configuration file."""
         default_config = {
@@ -116,15 +184,17 @@ class ContactsManager:
             Sprint 1: Exact match only
             Sprint 2: Will add fuzzy matching
         """
-        # Exact match (case-insensitive)
-        for contact in self.contacts:
-            if contact.name.lower() == name.lower():
-                logger.info(f"Found contact: {contact.name} -> {contact.phone}")
-                return contact
+        name_lower = name.lower()
 
-        # Try partial match (contains)
-        for contact in self.contacts:
-            if name.lower() in contact.name.lower():
+        # Exact match (case-insensitive)
+        contact = self._name_index.get(name_lower)
+        if contact is not None:
+            logger.info(f"Found contact: {contact.name} -> {contact.phone}")
+            return contact
+
+        # Try partial match (contains), over names lowercased at index time
+        for contact, contact_name in zip(self.contacts, self._names_lower):
+            if name_lower in contact_name:
                 logger.info(f"Partial match: {contact.name} -> {contact.phone}")
                 return contact
 
@@ -141,22 +211,65 @@ class ContactsManager:
         Returns:
             Contact object if found, None otherwise
         """
-        # Normalize phone for comparison (remove non-digits)
-        normalized_search = ''.join(c for c in phone if c.isdigit())
+        position = self._phone_position(phone)
 
-        for contact in self.contacts:
-            normalized_contact = ''.join(c for c in contact.phone if c.isdigit())
-
-            # Match if search phone is suffix of contact phone
-            # (handles +1 country code differences)
-            if (normalized_contact.endswith(normalized_search) or
-                normalized_search.endswith(normalized_contact)):
-                logger.info(f"Found contact by phone: {contact.name}")
-                return contact
+        if position is not None:
+            contact = self.contacts[position]
+            logger.info(f"Found contact by phone: {contact.name}")
+            return contact
 
         logger.warning(f"No contact found for phone: {phone}")
         return None
 
+    def get_contacts_by_phones(self, phones: Iterable[str]) -> Dict[str, Optional[Contact]]:
+        """
+        Get contacts for several phone numbers at once.
+
+        Matches like get_contact_by_phone, but logs one summary line for
+        the batch instead of a line per number.
+
+        Args:
+            phones: Phone numbers to search for (repeats are looked up once)
+
+        Returns:
+            Dict mapping each phone to its Contact, or None if not found
+        """
+        unique_phones = list(dict.fromkeys(phones))
+        all_contacts = self.contacts
+        contacts: Dict[str, Optional[Contact]] = {
+            phone: None if position is None else all_contacts[position]
+            for phone, position in zip(unique_phones, map(self._phone_position, unique_phones))
+        }
+
+        found = sum(contact is not None for contact in contacts.values())
+        logger.info(f"Found contacts for {found} of {len(contacts)} phones")
+        return contacts
+
+    def _phone_position(self, phone: str) -> Optional[int]:
+        """Memoized _find_phone_position."""
+        # Callers such as followup resolve the same handles repeatedly
+        try:
+            return self._phone_lookups[phone]
+        except KeyError:
+            position = self._phone_lookups[phone] = self._find_phone_position(phone)
+            return position
+
+    def _find_phone_position(self, phone: str) -> Optional[int]:
+        """List position of the contact matching phone, or None."""
+        # Normalize phone for comparison (remove non-digits)
+        normalized_search = _phone_digits(phone)
+
+        # Match if either number is a suffix of the other (handles +1 country
+        # code differences); the earliest matching contact wins.
+        # Contacts whose number ends with the search:
+        position = self._phone_suffix.get(normalized_search)
+        # Contacts whose number is a suffix of the search:
+        for i in range(len(normalized_search) + 1):
+            candidate = self._phone_exact.get(normalized_search[i:])
+            if candidate is not None and (position is None or candidate < position):
+                position = candidate
+        return position
+
     def list_contacts(self) -> List[Contact]:
         """
         Get all contacts.
@@ -191,6 +304,7 @@ class ContactsManager:
         """
         contact = Contact(name, phone, relationship_type, notes)
         self.contacts.append(contact)
+        self._index_contact(len(self.contacts) - 1, contact)
 
         # Save to config
         self._save_contacts()
@@ -201,8 +315,7 @@ class ContactsManager:
     def _save_contacts(self):
         """Save contacts back to configuration file."""
         try:
-            with open(self.config_path) as f:
-                data = json.load(f)
+            data = self._read_config()
 
             data["contacts"] = [c.to_dict() for c in self.contacts]
 
@@ -8,12 +8,22 @@ import logging
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
+# RapidFuzz (C++ scorers) is preferred; fuzzywuzzy has the same fuzz API.
+# Unlike fuzzywuzzy, RapidFuzz doesn't preprocess strings for the token
+# scorers by default, so TOKEN_KWARGS asks for it explicitly.
 try:
-    from fuzzywuzzy import fuzz
+    from rapidfuzz import fuzz
+    from rapidfuzz.utils import default_process
     FUZZY_AVAILABLE = True
+    TOKEN_KWARGS = {"processor": default_process}
 except ImportError:
-    FUZZY_AVAILABLE = False
-    logging.warning("fuzzywuzzy not available - fuzzy matching disabled")
+    try:
+        from fuzzywuzzy import fuzz
+        FUZZY_AVAILABLE = True
+        TOKEN_KWARGS = {}
+    except ImportError:
+        FUZZY_AVAILABLE = False
+        logging.warning("rapidfuzz not available - fuzzy matching disabled")
 
 logger = logging.getLogger(__name__)
 
@@ -317,7 +327,7 @@ class FuzzyNameMatcher:
         if not FUZZY_AVAILABLE:
             logger.warning(
                 "Fuzzy matching not available. Install with: "
-                "pip install fuzzywuzzy python-Levenshtein"
+                "pip install rapidfuzz"
             )
 
     def calculate_similarity(self, name1: str, name2: str) -> float:
@@ -335,10 +345,10 @@ class FuzzyNameMatcher:
             # Fallback to simple comparison
             return 1.0 if name1.lower() == name2.lower() else 0.0
 
-        # Normalize names
-        name1_norm = name1.lower().strip()
-        name2_norm = name2.lower().strip()
+        return self._similarity(name1.lower().strip(), name2.lower().strip())
 
+    def _similarity(self, name1_norm: str, name2_norm: str) -> float:
+        """calculate_similarity() for names already lowercased and stripped."""
         # Exact match
         if name1_norm == name2_norm:
             return 1.0
@@ -348,11 +358,11 @@ class FuzzyNameMatcher:
 
         # 1. Token sort ratio - handles word order differences
         # "John Doe" vs "Doe John" -> high score
-        scores.append(fuzz.token_sort_ratio(name1_norm, name2_norm))
+        scores.append(fuzz.token_sort_ratio(name1_norm, name2_norm, **TOKEN_KWARGS))
 
         # 2. Token set ratio - handles partial matches
         # "John Michael Doe" vs "John Doe" -> high score
-        scores.append(fuzz.token_set_ratio(name1_norm, name2_norm))
+        scores.append(fuzz.token_set_ratio(name1_norm, name2_norm, **TOKEN_KWARGS))
 
         # 3. Partial ratio - handles substring matches
         # "John" vs "John Doe" -> high score
@@ -364,6 +374,14 @@ class FuzzyNameMatcher:
         # Return best score (normalized to 0-1)
         return max(scores) / 100.0
 
+    def _score_all(self, query: str, candidates: List[str]) -> List[Tuple[str, float]]:
+        """Score every candidate against query, normalizing query only once."""
+        if not FUZZY_AVAILABLE:
+            return [(c, self.calculate_similarity(query, c)) for c in candidates]
+        query_norm = query.lower().strip()
+        similarity = self._similarity
+        return [(c, similarity(query_norm, c.lower().strip())) for c in candidates]
+
     def find_best_match(
         self,
         query: str,
@@ -383,10 +401,7 @@ class FuzzyNameMatcher:
             return None
 
         # Calculate scores for all candidates
-        scored = [
-            (candidate, self.calculate_similarity(query, candidate))
-            for candidate in candidates
-        ]
+        scored = self._score_all(query, candidates)
 
         # Sort by score (descending)
         scored.sort(key=lambda x: x[1], reverse=True)
@@ -428,10 +443,7 @@ class FuzzyNameMatcher:
             return []
 
         # Calculate scores for all candidates
-        scored = [
-            (candidate, self.calculate_similarity(query, candidate))
-            for candidate in candidates
-        ]
+        scored = self._score_all(query, candidates)
 
         # Filter by threshold and sort
         filtered = [
@@ -8,17 +8,52 @@ Sprint 1: Basic AppleScript sending
 Sprint 1.5: Message history reading with attributedBody parsing (macOS Ventura+)
 """
 
+import os
 import subprocess
 import sqlite3
 import logging
 import plistlib
 import re
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Iterable, Iterator, Tuple
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Applied to every read-only chat.db connection. Reads go through a 256 MiB
+# memory map instead of one pread() per page, the page cache is raised to
+# 64 MiB, temp b-trees (ORDER BY/GROUP BY) stay in memory, and query_only
+# rejects any write that slips through.
+READ_PRAGMAS = (
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA query_only=1",
+)
+
+# Full-text index over message text, kept beside (not in) the read-only
+# chat.db. The trigram tokenizer matches any substring of 3+ characters,
+# case-insensitively - the same results as the LIKE '%query%' scan it
+# replaces, from a posting-list lookup instead of a full table scan. It
+# keeps its own copy of the text, so an edited message's old postings can
+# be deleted.
+FTS_INDEX_PATH = Path.home() / ".cache" / "imessage-gateway" / "message_fts.db"
+FTS_MIN_QUERY_LENGTH = 3
+
+# Messages can be edited for 15 minutes after they're sent, so a message
+# edited after a given time was sent no more than this long before it.
+# Bounding message.date (which chat.db indexes) keeps the lookup for
+# edits since the last sync a short range scan. In chat.db's nanoseconds.
+EDIT_WINDOW_NS = 15 * 60 * 1_000_000_000
+
+# Applied to the search index's writer connection. In WAL mode searches
+# keep reading the index while another process appends to it, and
+# synchronous=NORMAL (safe under WAL) skips the fsync on every commit.
+INDEX_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+)
+
 
 def escape_applescript_string(s: str) -> str:
     r"""
@@ -95,6 +130,26 @@ def sanitize_like_pattern(value: str) -> str:
     return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
 
 
+def prefix_range(prefix: str) -> Tuple[str, str]:
+    """
+    Bounds of the half-open string range holding every value that starts with prefix.
+
+    `column >= low AND column < high` is an index-usable (and wildcard-free)
+    equivalent of `column LIKE 'prefix%'`, but case-sensitive.
+
+    Args:
+        prefix: Non-empty prefix
+
+    Returns:
+        (low, high): prefix, and prefix with its last character incremented
+
+    Example:
+        >>> prefix_range("image/")
+        ('image/', 'image0')
+    """
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
 def parse_attributed_body(blob: bytes) -> Optional[str]:
     """
     Parse the attributedBody column from macOS Messages database.
@@ -269,16 +324,223 @@ def extract_text_from_blob(blob: bytes) -> Optional[str]:
 class MessagesInterface:
     """Interface to macOS Messages app."""
 
-    def __init__(self, messages_db_path: str = "~/Library/Messages/chat.db"):
+    def __init__(
+        self,
+        messages_db_path: str = "~/Library/Messages/chat.db",
+        fts_index_path: Optional[str] = None
+    ):
         """
         Initialize Messages interface.
 
         Args:
             messages_db_path: Path to Messages database (default: standard location)
+            fts_index_path: Where to keep the search_messages index
+                (default: FTS_INDEX_PATH)
         """
         self.messages_db_path = Path(messages_db_path).expanduser()
+        self.fts_index_path = Path(fts_index_path or FTS_INDEX_PATH).expanduser()
         logger.info(f"Initialized MessagesInterface with DB: {self.messages_db_path}")
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open chat.db read-only with READ_PRAGMAS applied."""
+        conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+        for pragma in READ_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _sync_fts_index(self) -> bool:
+        """
+        Bring the search_messages index up to date with chat.db.
+
+        Only messages with a ROWID above the last one indexed are read, so
+        after the first build this costs one small range scan per search.
+        Messages edited since the last sync are re-indexed with their new
+        text. The write lock is taken only when there is work to do.
+        Text is taken from message.text, or decoded from attributedBody.
+
+        Returns:
+            bool: False if the index can't be used (no FTS5 trigram support,
+                unwritable location, locked, ...)
+        """
+        try:
+            index = self._open_fts_index()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Search index unavailable: {e}")
+            return False
+
+        conn = None
+        try:
+            for pragma in INDEX_PRAGMAS:
+                index.execute(pragma)
+
+            # Check for new and edited messages without a lock first, so
+            # concurrent searches only contend for the write lock when
+            # there's work
+            conn = self._connect()
+            max_rowid = conn.execute("SELECT MAX(ROWID) FROM message").fetchone()[0] or 0
+            track_edits = self._has_edit_dates(conn)
+            state = self._fts_state(index)
+            if (state is not None and state[0] >= max_rowid
+                    and not (track_edits and self._has_edits_since(conn, state[1]))):
+                return True
+
+            # One writer at a time, so concurrent CLI calls don't index twice
+            index.execute("BEGIN IMMEDIATE")
+            columns = [row[1] for row in index.execute("PRAGMA table_info(fts_state)")]
+            if columns and "last_edited" not in columns:
+                # Contentless index from an older build: its postings can't
+                # be deleted, so edited messages couldn't be re-indexed
+                index.execute("DROP TABLE IF EXISTS message_fts")
+                index.execute("DROP TABLE fts_state")
+            index.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS message_fts "
+                "USING fts5(text, tokenize='trigram')"
+            )
+            index.execute(
+                "CREATE TABLE IF NOT EXISTS fts_state "
+                "(db_path TEXT NOT NULL, last_rowid INTEGER NOT NULL, "
+                "last_edited INTEGER NOT NULL)"
+            )
+            # Re-read under the lock: another process may have caught up
+            state = self._fts_state(index)
+            if state is None:
+                # Unbuilt, or built from a different chat.db
+                index.execute("DELETE FROM message_fts")
+                state = (0, 0)
+            last_rowid, last_edited = state
+            # Edit dates share message.date's clock, so the newest message
+            # stands for "now" on that clock
+            new_edited = max(
+                last_edited,
+                conn.execute("SELECT MAX(date) FROM message").fetchone()[0] or 0,
+            )
+            if track_edits and last_rowid:
+                cursor = conn.execute(
+                    """
+                    SELECT ROWID, text, attributedBody, date_edited
+                    FROM message
+                    WHERE date >= ? AND date_edited > ? AND ROWID <= ?
+                    """,
+                    (last_edited - EDIT_WINDOW_NS, last_edited, last_rowid)
+                )
+                edited = 0
+                for rowid, text, attributed_body, date_edited in cursor:
+                    index.execute("DELETE FROM message_fts WHERE rowid = ?", (rowid,))
+                    text = text or extract_text_from_blob(attributed_body)
+                    if text:
+                        index.execute(
+                            "INSERT INTO message_fts(rowid, text) VALUES (?, ?)",
+                            (rowid, text)
+                        )
+                    new_edited = max(new_edited, date_edited)
+                    edited += 1
+                if edited:
+                    logger.info(f"Re-indexed {edited} edited messages for search")
+
+            if max_rowid > last_rowid:
+                cursor = conn.execute(
+                    """
+                    SELECT ROWID, text, attributedBody
+                    FROM message
+                    WHERE ROWID > ? AND ROWID <= ?
+                        AND (text IS NOT NULL OR attributedBody IS NOT NULL)
+                    """,
+                    (last_rowid, max_rowid)
+                )
+                rows = (
+                    (rowid, text or extract_text_from_blob(attributed_body))
+                    for rowid, text, attributed_body in cursor
+                )
+                index.executemany(
+                    "INSERT INTO message_fts(rowid, text) VALUES (?, ?)",
+                    (row for row in rows if row[1])
+                )
+                if track_edits:
+                    # New rows went in with their current text
+                    new_edited = max(new_edited, conn.execute(
+                        "SELECT MAX(date_edited) FROM message WHERE ROWID > ? AND ROWID <= ?",
+                        (last_rowid, max_rowid)
+                    ).fetchone()[0] or 0)
+                logger.info(f"Indexed messages {last_rowid + 1}-{max_rowid} for search")
+
+            index.execute("DELETE FROM fts_state")
+            index.execute(
+                "INSERT INTO fts_state (db_path, last_rowid, last_edited) VALUES (?, ?, ?)",
+                (str(self.messages_db_path), max(max_rowid, last_rowid), new_edited)
+            )
+            index.execute("COMMIT")
+            return True
+
+        except sqlite3.Error as e:
+            logger.warning(f"Search index unavailable: {e}")
+            if index.in_transaction:
+                index.execute("ROLLBACK")
+            return False
+        finally:
+            if conn is not None:
+                conn.close()
+            index.close()
+
+    def _open_fts_index(self) -> sqlite3.Connection:
+        """
+        Open the search index, readable by the current user only.
+
+        The index holds message text copied out of chat.db, which macOS
+        guards with Full Disk Access, so its directory is kept 0700 and its
+        files 0600 - including ones left by an older, laxer build.
+        """
+        directory = self.fts_index_path.parent
+        old_umask = os.umask(0o077)
+        try:
+            directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            index = sqlite3.connect(self.fts_index_path, isolation_level=None)
+        finally:
+            os.umask(old_umask)
+
+        if directory.stat().st_mode & 0o077:
+            directory.chmod(0o700)
+        for suffix in ("", "-wal", "-shm"):
+            path = Path(f"{self.fts_index_path}{suffix}")
+            try:
+                if path.stat().st_mode & 0o077:
+                    path.chmod(0o600)
+            except FileNotFoundError:
+                pass
+        return index
+
+    @staticmethod
+    def _has_edit_dates(conn: sqlite3.Connection) -> bool:
+        """Whether chat.db records message edits (macOS Ventura and later)."""
+        return any(
+            column[1] == "date_edited"
+            for column in conn.execute("PRAGMA table_info(message)")
+        )
+
+    @staticmethod
+    def _has_edits_since(conn: sqlite3.Connection, last_edited: int) -> bool:
+        """Whether any message was edited after last_edited."""
+        return conn.execute(
+            "SELECT 1 FROM message WHERE date >= ? AND date_edited > ? LIMIT 1",
+            (last_edited - EDIT_WINDOW_NS, last_edited)
+        ).fetchone() is not None
+
+    def _fts_state(self, index: sqlite3.Connection) -> Optional[Tuple[int, int]]:
+        """
+        (last ROWID, last edit date) the search index holds for this chat.db.
+
+        None if the index is unbuilt, from an older build, or was built
+        from a different chat.db.
+        """
+        try:
+            state = index.execute(
+                "SELECT db_path, last_rowid, last_edited FROM fts_state"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return None  # Tables not created yet, or an older layout
+        if state and state[0] == str(self.messages_db_path):
+            return state[1], state[2]
+        return None
+
     def send_message(self, phone: str, message: str) -> dict:
         """
         Send an iMessage using AppleScript.
@@ -368,15 +630,38 @@ class MessagesInterface:
             # Page 2: messages 100-199
             get_recent_messages(phone, limit=100, offset=100)
         """
+        messages = list(self.iter_recent_messages(phone, limit=limit, offset=offset))
+        logger.info(f"Retrieved {len(messages)} messages")
+        return messages
+
+    def iter_recent_messages(
+        self,
+        phone: str,
+        limit: int = 20,
+        offset: int = 0
+    ) -> Iterator[Dict]:
+        """
+        Yield recent messages with a contact, one row at a time.
+
+        Same rows and dicts as get_recent_messages(), but streamed from the
+        SQLite cursor instead of collected into a list, so a caller that
+        formats each message as it goes holds one row at a time. Database
+        errors are logged and end the iteration.
+        """
         logger.info(f"Retrieving recent messages for {phone}")
 
         if not self.messages_db_path.exists():
             logger.error(f"Messages database not found: {self.messages_db_path}")
-            return []
+            return
 
         try:
             # Connect to Messages database (read-only)
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
+        except sqlite3.Error as e:
+            logger.error(f"Database error: {e}")
+            return
+
+        try:
             cursor = conn.cursor()
 
             # Query messages for this contact
@@ -398,10 +683,8 @@ class MessagesInterface:
 
             # macOS Messages uses time since 2001-01-01 (Cocoa reference date)
             cursor.execute(query, (f"%{phone}%", limit, offset))
-            rows = cursor.fetchall()
 
-            messages = []
-            for row in rows:
+            for row in cursor:
                 text, attributed_body, date_cocoa, is_from_me, cache_roomnames = row
 
                 # Try to get text content:
@@ -422,24 +705,20 @@ class MessagesInterface:
                 # Check if this is a group chat
                 is_group_chat = is_group_chat_identifier(cache_roomnames)
 
-                messages.append({
+                yield {
                     "text": message_text or "[message content not available]",
                     "date": date.isoformat() if date else None,
                     "is_from_me": bool(is_from_me),
                     "is_group_chat": is_group_chat,
                     "group_id": cache_roomnames if is_group_chat else None
-                })
-
-            conn.close()
-            logger.info(f"Retrieved {len(messages)} messages")
-            return messages
+                }
 
         except sqlite3.Error as e:
             logger.error(f"Database error: {e}")
-            return []
         except Exception as e:
             logger.error(f"Error retrieving messages: {e}")
-            return []
+        finally:
+            conn.close()
 
     def check_permissions(self) -> dict:
         """
@@ -489,7 +768,7 @@ class MessagesInterface:
             return []
 
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
             cursor = conn.cursor()
 
             # Query recent messages across all conversations
@@ -574,48 +853,140 @@ class MessagesInterface:
             last_indexed = datetime(2025, 12, 31, 12, 0, 0)
             new_messages = interface.get_messages_since(last_indexed)
         """
+        messages = list(self.iter_messages_since(since, limit=limit))
+        logger.info(f"Retrieved {len(messages)} messages since {since.isoformat()}")
+        return messages
+
+    def iter_messages_since(
+        self,
+        since: datetime,
+        limit: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """
+        Yield messages since a timestamp, oldest first, one row at a time.
+
+        Same rows and dicts as get_messages_since(), but streamed from the
+        SQLite cursor, so an indexer can start chunking before the last
+        row is read. Database errors are logged and end the iteration.
+        """
         logger.info(f"Retrieving messages since {since.isoformat()}")
 
+        # Convert datetime to Cocoa timestamp (nanoseconds since 2001-01-01)
+        delta = since - datetime(2001, 1, 1)
+        cocoa_timestamp = int(delta.total_seconds() * 1_000_000_000)
+
+        return self._iter_messages_where("message.date >= ?", (cocoa_timestamp,), limit)
+
+    def get_messages_since_rowid(
+        self,
+        rowid: int,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Get messages stored after a message row ID.
+
+        Incremental indexing: ROWIDs only grow as Messages.app inserts rows,
+        so resuming after the last indexed ROWID is an index seek that
+        neither refetches messages sharing the last timestamp nor misses
+        older messages synced in later.
+
+        Args:
+            rowid: Return messages with ROWID > this value
+            limit: Optional maximum number of messages to fetch (the
+                lowest ROWIDs, so the next call resumes where this ended)
+
+        Returns:
+            List[Dict]: Same dicts as get_messages_since(), sorted by
+                date ascending
+        """
+        messages = list(self.iter_messages_since_rowid(rowid, limit=limit))
+        logger.info(f"Retrieved {len(messages)} messages since row {rowid}")
+        return messages
+
+    def iter_messages_since_rowid(
+        self,
+        rowid: int,
+        limit: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """Streaming form of get_messages_since_rowid()."""
+        logger.info(f"Retrieving messages since row {rowid}")
+        return self._iter_messages_where(
+            "message.ROWID > ?", (rowid,), limit, limit_order="message.ROWID"
+        )
+
+    def iter_all_recent_conversations(self, limit: int = 20) -> Iterator[Dict]:
+        """
+        Yield the rows of get_all_recent_conversations(), oldest first.
+
+        Streams from the SQLite cursor in the same dicts as
+        get_messages_since(), so an indexer can start chunking the most
+        recent `limit` messages before the last one is read.
+        """
+        logger.info(f"Retrieving {limit} most recent messages from all conversations")
+        return self._iter_messages_where(
+            "1", (), limit, limit_order="message.date DESC"
+        )
+
+    def _iter_messages_where(
+        self,
+        condition: str,
+        params: tuple,
+        limit: Optional[int],
+        limit_order: str = "message.date",
+    ) -> Iterator[Dict]:
+        """
+        Yield messages matching a WHERE condition, oldest first.
+
+        With a limit, the rows kept are the first `limit` by limit_order
+        (then sorted by date). Each dict carries the message's "rowid".
+        """
         if not self.messages_db_path.exists():
             logger.error(f"Messages database not found: {self.messages_db_path}")
-            return []
+            return
 
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
-            cursor = conn.cursor()
+            conn = self._connect()
+        except sqlite3.Error as e:
+            logger.error(f"Database error: {e}")
+            return
 
-            # Convert datetime to Cocoa timestamp (nanoseconds since 2001-01-01)
+        try:
+            cursor = conn.cursor()
             cocoa_epoch = datetime(2001, 1, 1)
-            delta = since - cocoa_epoch
-            cocoa_timestamp = int(delta.total_seconds() * 1_000_000_000)
 
-            # Query messages since timestamp
             # ORDER BY ASC for chronological processing
-            query = """
+            query = f"""
                 SELECT
                     message.text,
                     message.attributedBody,
                     message.date,
                     message.is_from_me,
                     handle.id,
-                    message.cache_roomnames
+                    message.cache_roomnames,
+                    message.ROWID
                 FROM message
                 LEFT JOIN handle ON message.handle_id = handle.ROWID
-                WHERE message.date >= ?
-                ORDER BY message.date ASC
+                WHERE {condition}
             """
+            params = list(params)
 
-            params = [cocoa_timestamp]
-            if limit:
-                query += " LIMIT ?"
+            if limit and limit_order != "message.date":
+                query = f"""
+                    SELECT * FROM ({query} ORDER BY {limit_order} LIMIT ?)
+                    ORDER BY date ASC
+                """
                 params.append(limit)
+            else:
+                query += " ORDER BY message.date ASC"
+                if limit:
+                    query += " LIMIT ?"
+                    params.append(limit)
 
             cursor.execute(query, params)
-            rows = cursor.fetchall()
 
-            messages = []
-            for row in rows:
-                text, attributed_body, date_cocoa, is_from_me, handle_id, cache_roomnames = row
+            for row in cursor:
+                (text, attributed_body, date_cocoa, is_from_me, handle_id,
+                 cache_roomnames, rowid) = row
 
                 # Extract message text
                 message_text = text
@@ -631,7 +1002,7 @@ class MessagesInterface:
                 # Check if this is a group chat
                 is_group_chat = is_group_chat_identifier(cache_roomnames)
 
-                messages.append({
+                yield {
                     "text": message_text or "[message content not available]",
                     "date": date.isoformat() if date else None,
                     "is_from_me": bool(is_from_me),
@@ -639,19 +1010,16 @@ class MessagesInterface:
                     "contact_name": None,
                     "is_group_chat": is_group_chat,
                     "group_id": cache_roomnames if is_group_chat else None,
-                    "sender_handle": handle_id
-                })
-
-            conn.close()
-            logger.info(f"Retrieved {len(messages)} messages since {since.isoformat()}")
-            return messages
+                    "sender_handle": handle_id,
+                    "rowid": rowid,
+                }
 
         except sqlite3.Error as e:
             logger.error(f"Database error: {e}")
-            return []
         except Exception as e:
             logger.error(f"Error retrieving messages: {e}")
-            return []
+        finally:
+            conn.close()
 
     def search_messages(
         self,
@@ -691,13 +1059,36 @@ class MessagesInterface:
             logger.error(f"Messages database not found: {self.messages_db_path}")
             return []
 
+        # Queries shorter than a trigram can't use the index
+        use_fts = len(query) >= FTS_MIN_QUERY_LENGTH and self._sync_fts_index()
+
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
             cursor = conn.cursor()
 
+            if use_fts:
+                conn.execute(
+                    "ATTACH DATABASE ? AS fts",
+                    (f"file:{self.fts_index_path}?mode=ro",)
+                )
+                match_filter = (
+                    "message.ROWID IN "
+                    "(SELECT rowid FROM fts.message_fts WHERE message_fts MATCH ?)"
+                )
+                # Every candidate is still checked against its current
+                # text below (an unsent message keeps its postings), so the
+                # limit is applied after that check
+                sql_limit = -1
+                # A quoted FTS5 phrase: query is matched literally
+                match_param = '"' + query.replace('"', '""') + '"'
+            else:
+                match_filter = "(message.text LIKE ? OR message.attributedBody IS NOT NULL)"
+                match_param = f"%{query}%"
+                sql_limit = limit
+
             # Build query based on whether we're filtering by phone
             if phone:
-                sql_query = """
+                sql_query = f"""
                     SELECT
                         message.text,
                         message.attributedBody,
@@ -707,14 +1098,14 @@ class MessagesInterface:
                         message.cache_roomnames
                     FROM message
                     JOIN handle ON message.handle_id = handle.ROWID
-                    WHERE (message.text LIKE ? OR message.attributedBody IS NOT NULL)
+                    WHERE {match_filter}
                         AND handle.id LIKE ?
                     ORDER BY message.date DESC
                     LIMIT ?
                 """
-                cursor.execute(sql_query, (f"%{query}%", f"%{phone}%", limit))
+                cursor.execute(sql_query, (match_param, f"%{phone}%", sql_limit))
             else:
-                sql_query = """
+                sql_query = f"""
                     SELECT
                         message.text,
                         message.attributedBody,
@@ -724,16 +1115,14 @@ class MessagesInterface:
                         message.cache_roomnames
                     FROM message
                     LEFT JOIN handle ON message.handle_id = handle.ROWID
-                    WHERE message.text LIKE ? OR message.attributedBody IS NOT NULL
+                    WHERE {match_filter}
                     ORDER BY message.date DESC
                     LIMIT ?
                 """
-                cursor.execute(sql_query, (f"%{query}%", limit))
-
-            rows = cursor.fetchall()
+                cursor.execute(sql_query, (match_param, sql_limit))
 
             messages = []
-            for row in rows:
+            for row in cursor:
                 text, attributed_body, date_cocoa, is_from_me, handle_id, cache_roomnames = row
 
                 # Extract message text
@@ -771,6 +1160,8 @@ class MessagesInterface:
                     "is_group_chat": is_group_chat,
                     "group_id": cache_roomnames if is_group_chat else None
                 })
+                if len(messages) >= limit:
+                    break
 
             conn.close()
             logger.info(f"Found {len(messages)} messages matching '{query}'")
@@ -812,7 +1203,7 @@ class MessagesInterface:
             return []
 
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
             cursor = conn.cursor()
 
             # Query group chats from chat table
@@ -927,7 +1318,7 @@ class MessagesInterface:
             return []
 
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
             cursor = conn.cursor()
 
             # First, find the chat(s) that match
@@ -1126,7 +1517,7 @@ class MessagesInterface:
             return []
 
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
             cursor = conn.cursor()
 
             # Build query with optional filters
@@ -1157,8 +1548,10 @@ class MessagesInterface:
                 params.append(f"%{sanitize_like_pattern(phone)}%")
 
             if mime_type_filter:
-                query += " AND a.mime_type LIKE ?"
-                params.append(f"{mime_type_filter}%")
+                # MIME types are stored lowercase; match them like the
+                # (ASCII case-insensitive) LIKE this replaces
+                query += " AND a.mime_type >= ? AND a.mime_type < ?"
+                params.extend(prefix_range(mime_type_filter.lower()))
 
             query += " ORDER BY m.date DESC LIMIT ?"
             params.append(limit)
@@ -1239,7 +1632,7 @@ class MessagesInterface:
             return []
 
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
             cursor = conn.cursor()
 
             # Query for unread incoming messages
@@ -1347,7 +1740,7 @@ class MessagesInterface:
             return []
 
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
             cursor = conn.cursor()
 
             # Build query for reaction messages
@@ -1462,7 +1855,7 @@ class MessagesInterface:
             return {}
 
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
             cursor = conn.cursor()
 
             # Calculate date threshold
@@ -1629,7 +2022,7 @@ class MessagesInterface:
             return []
 
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
             cursor = conn.cursor()
 
             # If we have message_guid but not thread_originator, find the originator
@@ -1742,7 +2135,7 @@ class MessagesInterface:
             return []
 
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
             cursor = conn.cursor()
 
             # URL regex pattern
@@ -1891,7 +2284,7 @@ class MessagesInterface:
             return []
 
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
             cursor = conn.cursor()
 
             # Query for audio messages
@@ -1985,7 +2378,7 @@ class MessagesInterface:
             return []
 
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
             cursor = conn.cursor()
 
             # Query for scheduled messages (schedule_type = 2)
@@ -2055,6 +2448,10 @@ class MessagesInterface:
         # a clearer interface for the MCP tool
         return self.get_recent_messages(phone=phone, limit=limit)
 
+    def iter_messages_by_phone(self, phone: str, limit: int = 20) -> Iterator[Dict]:
+        """Streaming get_messages_by_phone() (see iter_recent_messages)."""
+        return self.iter_recent_messages(phone=phone, limit=limit)
+
     # ===== T2 FEATURES =====
 
     def get_conversation_for_summary(
@@ -2095,7 +2492,7 @@ class MessagesInterface:
             return {}
 
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
             cursor = conn.cursor()
 
             # Build query
@@ -2124,25 +2521,17 @@ class MessagesInterface:
             params.append(limit)
 
             cursor.execute(query, params)
-            rows = cursor.fetchall()
-
-            if not rows:
-                conn.close()
-                return {
-                    "phone": phone,
-                    "message_count": 0,
-                    "conversation_text": "",
-                    "error": "No messages found"
-                }
 
-            # Process messages
+            # Process messages as the cursor streams them
             messages = []
+            row_count = 0
             sent_count = 0
             received_count = 0
             total_length = 0
             word_freq = {}
 
-            for row in rows:
+            for row in cursor:
+                row_count += 1
                 text, attributed_body, date_cocoa, is_from_me = row
 
                 # Extract text
@@ -2189,7 +2578,7 @@ class MessagesInterface:
                     "phone": phone,
                     "message_count": 0,
                     "conversation_text": "",
-                    "error": "No text messages found"
+                    "error": "No text messages found" if row_count else "No messages found"
                 }
 
             # Build formatted conversation text
@@ -2322,7 +2711,7 @@ class MessagesInterface:
             return {}
 
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
             cursor = conn.cursor()
 
             # Calculate date thresholds
@@ -2540,7 +2929,7 @@ class MessagesInterface:
             return []
 
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
             cursor = conn.cursor()
 
             # Calculate cutoff date in Cocoa timestamp format
@@ -2597,7 +2986,7 @@ class MessagesInterface:
 
     def search_unknown_senders(
         self,
-        known_phones: List[str],
+        known_phones: Iterable[str],
         days: int = 30,
         limit: int = 100
     ) -> List[Dict]:
@@ -2609,7 +2998,8 @@ class MessagesInterface:
         business contacts, or people you haven't added to contacts.
 
         Args:
-            known_phones: List of normalized phone numbers from contacts
+            known_phones: Phone numbers from contacts, in any format and any
+                iterable (a set avoids duplicates); normalized once here
             days: Number of days to look back
             limit: Maximum messages to return
 
@@ -2626,7 +3016,9 @@ class MessagesInterface:
             logger.error(f"Messages database not found: {self.messages_db_path}")
             return []
 
-        # Normalize known phones for comparison (remove non-digits)
+        # Normalize known phones for comparison (remove non-digits). The
+        # last-10-digit form of every known phone is in the set too, so each
+        # handle is classified with at most two set lookups.
         normalized_known = set()
         for phone in known_phones:
             normalized = "".join(c for c in phone if c.isdigit())
@@ -2637,7 +3029,7 @@ class MessagesInterface:
                     normalized_known.add(normalized[-10:])
 
         try:
-            conn = sqlite3.connect(f"file:{self.messages_db_path}?mode=ro", uri=True)
+            conn = self._connect()
             cursor = conn.cursor()
 
             # Calculate cutoff date in Cocoa timestamp format
@@ -2658,59 +3050,60 @@ class MessagesInterface:
                 ORDER BY last_message_date DESC
             """
 
-            cursor.execute(handles_query, (cutoff_cocoa,))
-            all_handles = cursor.fetchall()
-
-            # Filter to unknown handles
+            # Filter to unknown handles. Rows arrive newest first, so stop
+            # reading once the 20 most recent unknown handles are found.
             unknown_handles = []
-            for handle, msg_count, last_date in all_handles:
+            for handle, msg_count, last_date in conn.execute(handles_query, (cutoff_cocoa,)):
                 handle_normalized = "".join(c for c in handle if c.isdigit())
 
-                # Check if this handle matches any known phone (bidirectional matching)
-                is_known = False
-
-                # Direct full match
-                if handle_normalized in normalized_known:
-                    is_known = True
-                # Check if handle's last 10 digits match any known phone
-                elif len(handle_normalized) >= 10 and handle_normalized[-10:] in normalized_known:
-                    is_known = True
-                # Bidirectional check: does any known phone end with this handle's last 10?
-                elif len(handle_normalized) >= 10:
-                    handle_last_10 = handle_normalized[-10:]
-                    for known in known_phones:
-                        known_digits = "".join(c for c in known if c.isdigit())
-                        if len(known_digits) >= 10 and known_digits.endswith(handle_last_10):
-                            is_known = True
-                            break
+                # Known if the full number matches, or its last 10 digits match
+                # a known phone's last 10 (with or without country code)
+                is_known = handle_normalized in normalized_known or (
+                    len(handle_normalized) >= 10 and handle_normalized[-10:] in normalized_known
+                )
 
                 if not is_known:
                     unknown_handles.append((handle, msg_count, last_date))
+                    if len(unknown_handles) == 20:  # Max 20 unknown handles
+                        break
 
             # Get recent messages for each unknown handle (limited)
             unknown_senders = []
-            messages_per_handle = max(1, limit // max(1, len(unknown_handles[:20])))
-
-            for handle, msg_count, last_date_cocoa in unknown_handles[:20]:  # Max 20 unknown handles
-                # Get sample messages from this handle
-                msg_query = """
-                    SELECT
-                        message.text,
-                        message.attributedBody,
-                        message.date,
-                        message.is_from_me
-                    FROM message
-                    JOIN handle ON message.handle_id = handle.ROWID
-                    WHERE handle.id = ? AND message.date > ?
-                    ORDER BY message.date DESC
-                    LIMIT ?
+            messages_per_handle = max(1, limit // max(1, len(unknown_handles)))
+
+            # Sample messages for all of them in one query: the newest
+            # messages_per_handle rows per handle, in date order
+            msg_rows_by_handle = {handle: [] for handle, _, _ in unknown_handles}
+            if unknown_handles:
+                placeholders = ", ".join("?" * len(unknown_handles))
+                msg_query = f"""
+                    SELECT handle, text, attributedBody, date, is_from_me
+                    FROM (
+                        SELECT
+                            handle.id AS handle,
+                            message.text,
+                            message.attributedBody,
+                            message.date,
+                            message.is_from_me,
+                            ROW_NUMBER() OVER (
+                                PARTITION BY handle.id ORDER BY message.date DESC
+                            ) AS row_number
+                        FROM message
+                        JOIN handle ON message.handle_id = handle.ROWID
+                        WHERE handle.id IN ({placeholders}) AND message.date > ?
+                    )
+                    WHERE row_number <= ?
+                    ORDER BY row_number
                 """
+                cursor.execute(msg_query, (
+                    *msg_rows_by_handle, cutoff_cocoa, messages_per_handle
+                ))
+                for handle, *msg_row in cursor:
+                    msg_rows_by_handle[handle].append(msg_row)
 
-                cursor.execute(msg_query, (handle, cutoff_cocoa, messages_per_handle))
-                msg_rows = cursor.fetchall()
-
+            for handle, msg_count, last_date_cocoa in unknown_handles:
                 messages = []
-                for text, blob, date_cocoa, is_from_me in msg_rows:
+                for text, blob, date_cocoa, is_from_me in msg_rows_by_handle[handle]:
                     # Extract text content
                     msg_text = text
                     if not msg_text and blob:
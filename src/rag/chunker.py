@@ -21,7 +21,7 @@ import hashlib
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Iterator
+from typing import List, Dict, Optional, Iterable, Iterator
 from collections import defaultdict
 
 logger = logging.getLogger(__name__)
@@ -199,6 +199,61 @@ class ConversationChunker:
         logger.info(f"Created {len(unique_chunks)} chunks from {len(messages)} messages")
         return unique_chunks
 
+    def iter_chunks(self, messages: Iterable[Dict]) -> Iterator[ConversationChunk]:
+        """
+        Stream conversation chunks from messages that arrive in date order.
+
+        Yields the same chunks as chunk_messages() (in the order their time
+        windows close rather than grouped by contact). A window is closed as
+        soon as its conversation has been quiet for more than `window_hours`
+        of stream time, so callers can embed early chunks while later
+        messages are still being read. Only open windows are held in memory.
+
+        Args:
+            messages: Message dicts sorted by date, oldest first
+
+        Yields:
+            ConversationChunk objects, each chunk_id at most once
+        """
+        window_delta = timedelta(hours=self.window_hours)
+        windows: Dict[str, List[Dict]] = {}  # contact -> open window's messages
+        last_times: Dict[str, datetime] = {}
+        seen = set()
+        next_sweep = None
+
+        def close(contact: str) -> Iterator[ConversationChunk]:
+            del last_times[contact]
+            chunk = self._create_chunk(windows.pop(contact), contact)
+            if chunk:
+                for normalized in self._normalize_chunk_sizes([chunk]):
+                    if normalized.chunk_id not in seen:
+                        seen.add(normalized.chunk_id)
+                        yield normalized
+
+        for msg in messages:
+            msg_time = self._parse_datetime(msg.get("date"))
+            if msg_time is None:
+                continue
+
+            # Any later message from a conversation idle this long would
+            # start a new window anyway
+            if next_sweep is None or msg_time > next_sweep:
+                for contact, last_time in list(last_times.items()):
+                    if msg_time - last_time > window_delta:
+                        yield from close(contact)
+                next_sweep = msg_time + window_delta
+
+            contact = self._group_key(msg)
+            last_time = last_times.get(contact)
+            if last_time and (msg_time - last_time) > window_delta:
+                yield from close(contact)
+
+            windows.setdefault(contact, []).append(msg)
+            last_times[contact] = msg_time
+
+        for contact in list(windows):
+            yield from close(contact)
+
     def _group_by_contact(self, messages: List[Dict]) -> Dict[str, List[Dict]]:
         """
         Group messages by contact/conversation.
@@ -212,17 +267,19 @@ class ConversationChunker:
         grouped = defaultdict(list)
 
         for msg in messages:
-            if msg.get("is_group_chat"):
-                # Group chats use group_id as key
-                key = msg.get("group_id") or "unknown_group"
-            else:
-                # Prefer enriched contact name, fall back to phone
-                key = msg.get("_contact_name") or msg.get("phone") or "unknown"
-
-            grouped[key].append(msg)
+            grouped[self._group_key(msg)].append(msg)
 
         return dict(grouped)
 
+    @staticmethod
+    def _group_key(msg: Dict) -> str:
+        """Contact/conversation identifier a message is grouped under."""
+        if msg.get("is_group_chat"):
+            # Group chats use group_id as key
+            return msg.get("group_id") or "unknown_group"
+        # Prefer enriched contact name, fall back to phone
+        return msg.get("_contact_name") or msg.get("phone") or "unknown"
+
     def _create_time_windows(
         self,
         messages: List[Dict],
@@ -332,7 +389,7 @@ class ConversationChunker:
             is_group=is_group,
             group_name=group_name,
             metadata={
-                "phones": list(set(m.get("phone") for m in messages if m.get("phone"))),
+                "phones": list(dict.fromkeys(m.get("phone") for m in messages if m.get("phone"))),
             },
         )
 
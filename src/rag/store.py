@@ -68,16 +68,24 @@ class EmbeddingProvider:
     Args:
         use_local: If True, use local sentence-transformers instead of OpenAI
         model: Model name (OpenAI: "text-embedding-3-small", local: "all-MiniLM-L6-v2")
+        dimensions: Shorter OpenAI embedding size (e.g. 384 instead of 1536).
+            text-embedding-3 models are trained so that truncated vectors
+            keep most of their retrieval quality, at a fraction of the
+            storage and search bandwidth. Not supported for local models.
     """
 
     def __init__(
         self,
         use_local: bool = False,
         model: Optional[str] = None,
+        dimensions: Optional[int] = None,
     ):
         self.use_local = use_local
+        self.requested_dimensions = dimensions
 
         if use_local:
+            if dimensions is not None:
+                raise ValueError("dimensions is only supported for OpenAI embeddings")
             self.model = model or "all-MiniLM-L6-v2"
             self._init_local_model()
         else:
@@ -94,7 +102,8 @@ class EmbeddingProvider:
                 "Either set it or use use_local=True for local embeddings."
             )
         self.client = OpenAI(api_key=api_key)
-        self.dimensions = 1536  # text-embedding-3-small dimensions
+        # text-embedding-3-small dimensions unless shortened
+        self.dimensions = self.requested_dimensions or 1536
         logger.info(f"Initialized OpenAI embeddings with model: {self.model}")
 
     def _init_local_model(self):
@@ -138,9 +147,13 @@ class EmbeddingProvider:
     def _embed_openai(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings using OpenAI API."""
         try:
+            options = {}
+            if self.requested_dimensions is not None:
+                options["dimensions"] = self.requested_dimensions
             response = self.client.embeddings.create(
                 model=self.model,
                 input=texts,
+                **options,
             )
             return [item.embedding for item in response.data]
         except Exception as e:
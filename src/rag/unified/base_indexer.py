@@ -10,15 +10,96 @@ implement the source-specific steps.
 """
 
 import logging
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Generator
+from itertools import islice
+from operator import attrgetter
+from queue import Full, Queue
+from typing import List, Optional, Dict, Any, Generator, Iterable, Iterator
 
 from .chunk import UnifiedChunk
 from .store import UnifiedVectorStore
 
 logger = logging.getLogger(__name__)
 
+# Chunk batches index() lets the fetch/chunk side run ahead of the store
+PIPELINE_DEPTH = 4
+
+# Embedding batches index() sorts by length together, so each batch the
+# embedder pads holds chunks of similar length
+LENGTH_SORT_BATCHES = 8
+
+
+def prefetch(items: Iterable, depth: int = PIPELINE_DEPTH) -> Generator:
+    """
+    Iterate over items on a background thread, at most `depth` items ahead.
+
+    The bounded queue applies backpressure: the producer blocks while the
+    consumer is behind. An exception raised by the producer is re-raised
+    to the consumer in order. Closing the generator stops the producer,
+    which closes items, and waits for the thread to finish, so nothing
+    runs on behalf of items once it returns.
+    """
+    queue: Queue = Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                queue.put(entry, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+        except BaseException as e:
+            put((done, e))
+        else:
+            put((done, None))
+        finally:
+            # Release what items holds (a database connection, say) on the
+            # thread that was using it
+            close = getattr(items, "close", None)
+            if close is not None:
+                close()
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = queue.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+def length_sorted_windows(chunks: Iterator[UnifiedChunk], size: int) -> Generator:
+    """
+    Group chunks into lists of up to `size`, each sorted by word count.
+
+    Closing the generator closes chunks.
+    """
+    try:
+        for window in iter(lambda: list(islice(chunks, size)), []):
+            window.sort(key=attrgetter("word_count"))
+            yield window
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
 
 class BaseSourceIndexer(ABC):
     """
@@ -43,6 +124,10 @@ class BaseSourceIndexer(ABC):
     # Must be set by subclasses
     source_name: str = ""
 
+    # Run iter_chunks() on a background thread during index(). Only for
+    # sources that are safe to read off the main thread
+    prefetch_chunks: bool = False
+
     def __init__(
         self,
         store: Optional[UnifiedVectorStore] = None,
@@ -96,6 +181,26 @@ class BaseSourceIndexer(ABC):
         """
         pass
 
+    def iter_chunks(
+        self,
+        days: Optional[int] = None,
+        limit: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[UnifiedChunk]:
+        """
+        Produce the UnifiedChunks index() stores.
+
+        The default fetches everything, then chunks it. Sources that can
+        chunk as data arrives override this, so that index() starts
+        embedding while the fetch is still running.
+
+        Args:
+            days: How many days of history to fetch
+            limit: Maximum number of items to fetch
+            **kwargs: Source-specific options
+        """
+        yield from self.chunk_data(self.fetch_data(days=days, limit=limit, **kwargs))
+
     def index(
         self,
         days: Optional[int] = None,
@@ -106,7 +211,12 @@ class BaseSourceIndexer(ABC):
         """
         Full indexing pipeline: fetch -> chunk -> store.
 
-        This is the main entry point for indexing a source.
+        This is the main entry point for indexing a source. Chunks from
+        iter_chunks() are taken in windows of LENGTH_SORT_BATCHES *
+        batch_size. Each window is sorted by word count and handed to the
+        store, which embeds it in batch_size slices in that order. With
+        prefetch_chunks set, windows are produced on a background thread,
+        at most PIPELINE_DEPTH ahead of the store.
 
         Args:
             days: How many days of history to index
@@ -121,54 +231,56 @@ class BaseSourceIndexer(ABC):
 
         logger.info(f"Starting {self.source_name} indexing (days={days}, limit={limit})")
 
-        # Step 1: Fetch data
-        try:
-            data = self.fetch_data(days=days, limit=limit, **kwargs)
-        except Exception as e:
-            logger.error(f"Failed to fetch {self.source_name} data: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "source": self.source_name,
-            }
+        chunks = self.iter_chunks(days=days, limit=limit, **kwargs)
+        batches = length_sorted_windows(chunks, batch_size * LENGTH_SORT_BATCHES)
+        if self.prefetch_chunks:
+            batches = prefetch(batches)
+        chunks_found = 0
+        indexed_count = 0
 
-        # Step 2: Convert to chunks
         try:
-            chunks = self.chunk_data(data)
-        except Exception as e:
-            logger.error(f"Failed to chunk {self.source_name} data: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "source": self.source_name,
-            }
+            while True:
+                # Step 1+2: Fetch data and convert to chunks
+                try:
+                    batch = next(batches, None)
+                except Exception as e:
+                    logger.error(f"Failed to fetch/chunk {self.source_name} data: {e}")
+                    return {
+                        "success": False,
+                        "error": str(e),
+                        "source": self.source_name,
+                    }
+                if batch is None:
+                    break
+                chunks_found += len(batch)
+
+                # Step 3: Add to store
+                try:
+                    result = self.store.add_chunks(batch, batch_size=batch_size)
+                    indexed_count += result.get(self.source_name, 0)
+                except Exception as e:
+                    logger.error(f"Failed to index {self.source_name} chunks: {e}")
+                    return {
+                        "success": False,
+                        "error": str(e),
+                        "source": self.source_name,
+                        "chunks_found": chunks_found,
+                    }
+        finally:
+            batches.close()
+
+        duration = (datetime.now() - start_time).total_seconds()
 
-        if not chunks:
+        if not chunks_found:
             logger.info(f"No {self.source_name} chunks to index")
             return {
                 "success": True,
                 "source": self.source_name,
                 "chunks_found": 0,
                 "chunks_indexed": 0,
-                "duration_seconds": (datetime.now() - start_time).total_seconds(),
-            }
-
-        logger.info(f"Created {len(chunks)} {self.source_name} chunks")
-
-        # Step 3: Add to store
-        try:
-            result = self.store.add_chunks(chunks, batch_size=batch_size)
-            indexed_count = result.get(self.source_name, 0)
-        except Exception as e:
-            logger.error(f"Failed to index {self.source_name} chunks: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "source": self.source_name,
-                "chunks_found": len(chunks),
+                "duration_seconds": duration,
             }
 
-        duration = (datetime.now() - start_time).total_seconds()
         self._indexed_count += indexed_count
 
         logger.info(
@@ -178,7 +290,7 @@ class BaseSourceIndexer(ABC):
         return {
             "success": True,
             "source": self.source_name,
-            "chunks_found": len(chunks),
+            "chunks_found": chunks_found,
             "chunks_indexed": indexed_count,
             "duration_seconds": duration,
         }
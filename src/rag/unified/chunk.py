@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+from ...compat import DATACLASS_SLOTS
+
 
 # Valid source types for the unified RAG system
 SOURCE_TYPES = frozenset([
@@ -36,7 +38,7 @@ CONTEXT_TYPES = frozenset([
 ])
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class UnifiedChunk:
     """
     Common chunk format for all data sources.
@@ -9,9 +9,12 @@ This follows the proven approach from the legacy iMessage RAG system.
 """
 
 import logging
-from datetime import datetime
+import os
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Iterable, Iterator
 
 from .base_indexer import BaseSourceIndexer
 from .chunk import UnifiedChunk
@@ -20,6 +23,55 @@ from ..chunker import ConversationChunker, ConversationChunk
 
 logger = logging.getLogger(__name__)
 
+# Messages read from the database per contact-resolution batch when streaming
+FETCH_BATCH_SIZE = 1000
+
+# Chunk title format and tags, keyed by ConversationChunk.is_group
+_TITLE = {True: "Group: %s", False: "Conversation with %s"}
+_TAGS = {True: ("group_chat",), False: ()}
+# Shared stand-in for a chunk without recorded phones
+_EMPTY_PHONES: tuple = ()
+
+
+# Find project root (4 levels up from this file)
+DEFAULT_CONTACTS_PATH = str(
+    Path(__file__).parent.parent.parent.parent / "config" / "contacts.json"
+)
+
+
+def _mtime_ns(path_str: str) -> Optional[int]:
+    """mtime_ns of a file, or None if it doesn't exist."""
+    try:
+        return os.stat(path_str).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=4)
+def _load_contacts_manager(path_str: str, mtime_ns: Optional[int]):
+    from ...contacts_manager import ContactsManager
+    return ContactsManager(path_str)
+
+
+@lru_cache(maxsize=4)
+def _load_index_state(path_str: str, mtime_ns: Optional[int]) -> IndexState:
+    return IndexState(Path(path_str))
+
+
+def _get_contacts_manager(path_str: str):
+    """
+    Return a shared ContactsManager for a contacts config path.
+
+    Indexers created in the same process reuse it until the file changes
+    on disk; _load_contacts_manager.cache_clear() forces a reload.
+    """
+    return _load_contacts_manager(path_str, _mtime_ns(path_str))
+
+
+def _get_index_state(path_str: str) -> IndexState:
+    """Return a shared IndexState for a state file, reloaded when it changes."""
+    return _load_index_state(path_str, _mtime_ns(path_str))
+
 
 class ImessageIndexer(BaseSourceIndexer):
     """
@@ -36,6 +88,8 @@ class ImessageIndexer(BaseSourceIndexer):
     """
 
     source_name = "imessage"
+    # Each fetch opens its own chat.db connection on the reading thread
+    prefetch_chunks = True
 
     def __init__(
         self,
@@ -55,11 +109,7 @@ class ImessageIndexer(BaseSourceIndexer):
             from ...messages_interface import MessagesInterface
             messages_interface = MessagesInterface()
         if contacts_manager is None:
-            from ...contacts_manager import ContactsManager
-            # Find project root (6 levels up from this file)
-            project_root = Path(__file__).parent.parent.parent.parent
-            contacts_path = project_root / "config" / "contacts.json"
-            contacts_manager = ContactsManager(str(contacts_path))
+            contacts_manager = _get_contacts_manager(DEFAULT_CONTACTS_PATH)
 
         self.messages = messages_interface
         self.contacts = contacts_manager
@@ -73,7 +123,27 @@ class ImessageIndexer(BaseSourceIndexer):
         # Default state file: ~/.imessage_rag/index_state.json
         if state_file is None:
             state_file = Path.home() / ".imessage_rag" / "index_state.json"
-        self.state = IndexState(state_file)
+        self.state = _get_index_state(str(state_file))
+        # Shortened embeddings are written to a collection of their own,
+        # which needs its own watermarks: history indexed into the
+        # full-size collection isn't in it
+        dimensions = getattr(self.store, "embedding_dimensions", None)
+        self.state_key = (
+            self.source_name if dimensions is None else f"{self.source_name}_d{dimensions}"
+        )
+        # Date of the newest message from the last fetch_data call
+        self._last_fetched_max_ts: Optional[datetime] = None
+        # Highest ROWID from the last fetch, when every earlier unindexed
+        # row was fetched too (so the next run can resume after it)
+        self._last_fetched_max_rowid: Optional[int] = None
+        self._rowid_resumable = False
+        # Chunk IDs iter_chunks leaves out (set for the duration of index())
+        # and the IDs of every chunk it came across last, skipped or not
+        self._skip_chunk_ids: Set[str] = set()
+        self._last_chunk_ids: List[str] = []
+        # One shared str per contact/phone across the chunks this indexer
+        # builds (each database row otherwise brings its own copy)
+        self._participant_pool: Dict[str, str] = {}
 
     def fetch_data(
         self,
@@ -95,62 +165,119 @@ class ImessageIndexer(BaseSourceIndexer):
         Returns:
             List of message dicts from MessagesInterface
         """
-        # Determine fetch strategy
+        messages = list(self._message_source(days, limit, contact_name, incremental))
+
+        # Enrich messages with contact names where available
+        if not contact_name:  # Skip if already enriched by _message_source
+            self._resolve_contact_names(messages)
+
+        self._last_fetched_max_ts = self._max_date(messages)
+        self._last_fetched_max_rowid = self._max_rowid(messages)
+
+        logger.info("Fetched %d iMessages", len(messages))
+        return messages
+
+    def _message_source(
+        self,
+        days: Optional[int],
+        limit: Optional[int],
+        contact_name: Optional[str],
+        incremental: bool,
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Pick the fetch strategy for fetch_data() and iter_chunks().
+
+        Returns a lazy, date-ordered iterator, except in contact mode,
+        which returns a list.
+        """
+        self._rowid_resumable = False
+
         if incremental and not days and not contact_name:
             # Incremental mode: fetch only new messages
-            last_indexed = self.state.get_last_indexed("imessage")
+            last_rowid = self.state.get_last_rowid(self.state_key)
+            last_indexed = self.state.get_last_indexed(self.state_key)
+
+            if last_rowid is not None:
+                logger.info("Incremental mode: fetching messages after row %d", last_rowid)
+                self._rowid_resumable = True
+                return self.messages.iter_messages_since_rowid(last_rowid, limit=limit)
 
             if last_indexed:
-                logger.info(f"Incremental mode: fetching messages since {last_indexed.isoformat()}")
-                messages = self.messages.get_messages_since(last_indexed, limit=limit)
-            else:
-                logger.info("No previous index state, doing full index")
-                limit = limit or 10000
-                messages = self.messages.get_all_recent_conversations(limit=limit)
-
-        elif days:
+                # State from before row IDs were recorded. Without a limit
+                # this fetches every row newer than the watermark, so its
+                # highest ROWID can take over as the watermark
+                logger.info("Incremental mode: fetching messages since %s", last_indexed.isoformat())
+                self._rowid_resumable = not limit
+                return self.messages.iter_messages_since(last_indexed, limit=limit)
+
+            logger.info("No previous index state, doing full index")
+            return self.messages.iter_all_recent_conversations(limit=limit or 10000)
+
+        if days:
             # Days mode: fetch last N days
-            logger.info(f"Days mode: fetching last {days} days")
-            from datetime import timedelta
+            logger.info("Days mode: fetching last %d days", days)
             cutoff = datetime.now() - timedelta(days=days)
+            return self.messages.iter_messages_since(cutoff, limit=limit)
 
-            messages = self.messages.get_messages_since(cutoff, limit=limit)
-
-        elif contact_name:
+        if contact_name:
             # Contact-specific mode
-            logger.info(f"Contact mode: fetching messages with {contact_name}")
+            logger.info("Contact mode: fetching messages with %s", contact_name)
             contact = self.contacts.get_contact_by_name(contact_name)
             if not contact:
                 raise ValueError(f"Contact '{contact_name}' not found")
 
-            limit = limit or 10000
+            # The handle filter runs in SQL; the rows it returns carry no
+            # phone, so the known contact is stamped on each one here
             messages = self.messages.get_recent_messages(
                 contact.phone,
-                limit=limit
+                limit=limit or 10000
             )
 
             # Enrich with contact name
+            enrich = {"_contact_name": contact.name, "phone": contact.phone}
             for msg in messages:
-                msg["_contact_name"] = contact.name
-                msg["phone"] = contact.phone
-
-        else:
-            # Full mode: fetch all recent
-            logger.info("Full mode: fetching all messages")
-            limit = limit or 10000
-            messages = self.messages.get_all_recent_conversations(limit=limit)
-
-        # Enrich messages with contact names where available
-        if not contact_name:  # Skip if already enriched above
-            for msg in messages:
-                phone = msg.get("phone")
-                if phone and "_contact_name" not in msg:
-                    contact = self.contacts.get_contact_by_phone(phone)
-                    if contact:
-                        msg["_contact_name"] = contact.name
+                msg.update(enrich)
+            return messages
+
+        # Full mode: fetch all recent
+        logger.info("Full mode: fetching all messages")
+        return self.messages.iter_all_recent_conversations(limit=limit or 10000)
+
+    def _resolve_contact_names(self, messages: List[Dict[str, Any]]) -> None:
+        """Set _contact_name on messages whose phone matches a contact."""
+        # Resolve each distinct phone once, not once per message
+        unique_phones = {
+            msg["phone"] for msg in messages
+            if msg.get("phone") and "_contact_name" not in msg
+        }
+        phone_to_name = {
+            phone: contact.name
+            for phone, contact in self.contacts.get_contacts_by_phones(unique_phones).items()
+            if contact
+        }
+        if not phone_to_name:
+            return
+
+        # One dict probe per message; phones without a contact miss here
+        lookup = phone_to_name.get
+        for msg in messages:
+            name = lookup(msg.get("phone"))
+            if name and "_contact_name" not in msg:
+                msg["_contact_name"] = name
+
+    def _max_rowid(self, messages: List[Dict[str, Any]]) -> Optional[int]:
+        """Highest message ROWID, or None if the fetch can't resume after it."""
+        if not self._rowid_resumable:
+            return None
+        rowids = [msg["rowid"] for msg in messages if msg.get("rowid") is not None]
+        return max(rowids) if rowids else None
 
-        logger.info(f"Fetched {len(messages)} iMessages")
-        return messages
+    @staticmethod
+    def _max_date(messages: List[Dict[str, Any]]) -> Optional[datetime]:
+        """Newest message date, or None if no message has one."""
+        # Dates are all isoformat() strings, which sort chronologically
+        dates = [msg["date"] for msg in messages if msg.get("date")]
+        return datetime.fromisoformat(max(dates)) if dates else None
 
     def chunk_data(self, messages: List[Dict[str, Any]]) -> List[UnifiedChunk]:
         """
@@ -168,19 +295,85 @@ class ImessageIndexer(BaseSourceIndexer):
         # Use ConversationChunker to create time-windowed chunks
         conversation_chunks = self.chunker.chunk_messages(messages)
 
-        # Convert ConversationChunks to UnifiedChunks
-        unified_chunks = []
-        for conv_chunk in conversation_chunks:
-            unified_chunk = self._conversation_chunk_to_unified(conv_chunk)
-            if unified_chunk:
-                unified_chunks.append(unified_chunk)
+        # Convert ConversationChunks to UnifiedChunks (dropping the None
+        # results for chunks too short to index)
+        unified_chunks = list(filter(
+            None, map(self._conversation_chunk_to_unified, conversation_chunks)
+        ))
 
         logger.info(
-            f"Created {len(unified_chunks)} unified chunks from "
-            f"{len(messages)} messages ({len(conversation_chunks)} conversations)"
+            "Created %d unified chunks from %d messages (%d conversations)",
+            len(unified_chunks), len(messages), len(conversation_chunks),
         )
         return unified_chunks
 
+    def iter_chunks(
+        self,
+        days: Optional[int] = None,
+        limit: Optional[int] = None,
+        contact_name: Optional[str] = None,
+        incremental: bool = True,
+        **kwargs,
+    ) -> Iterator[UnifiedChunk]:
+        """
+        Stream UnifiedChunks while messages are still being read.
+
+        Messages are resolved to contacts FETCH_BATCH_SIZE at a time and
+        chunked with ConversationChunker.iter_chunks(), which yields each
+        conversation chunk as soon as its time window closes. Produces the
+        same chunks as chunk_data(fetch_data(...)).
+
+        Args:
+            days: Days of history to fetch (overrides incremental mode if set)
+            limit: Maximum messages to fetch
+            contact_name: Fetch messages only with this contact
+            incremental: If True, only fetch messages since last index (default: True)
+
+        Yields:
+            UnifiedChunks ready for indexing
+        """
+        source = self._message_source(days, limit, contact_name, incremental)
+        if isinstance(source, list):
+            # Contact mode comes back newest first
+            source.sort(key=lambda m: m.get("date") or "1970-01-01")
+        source = iter(source)
+        self._last_fetched_max_ts = None
+        self._last_fetched_max_rowid = None
+        counts = {"messages": 0, "conversations": 0, "chunks": 0}
+
+        def messages() -> Iterator[Dict[str, Any]]:
+            for batch in iter(lambda: list(islice(source, FETCH_BATCH_SIZE)), []):
+                if not contact_name:  # Skip if already enriched by _message_source
+                    self._resolve_contact_names(batch)
+                batch_max = self._max_date(batch)
+                if batch_max and (not self._last_fetched_max_ts
+                                  or batch_max > self._last_fetched_max_ts):
+                    self._last_fetched_max_ts = batch_max
+                batch_rowid = self._max_rowid(batch)
+                if batch_rowid is not None and (self._last_fetched_max_rowid is None
+                                                or batch_rowid > self._last_fetched_max_rowid):
+                    self._last_fetched_max_rowid = batch_rowid
+                counts["messages"] += len(batch)
+                yield from batch
+
+        for conv_chunk in self.chunker.iter_chunks(messages()):
+            counts["conversations"] += 1
+            # Chunk IDs hash the chunk's content, so a known ID is an
+            # unchanged chunk that's already in the store
+            if conv_chunk.chunk_id in self._skip_chunk_ids:
+                self._last_chunk_ids.append(conv_chunk.chunk_id)
+                continue
+            chunk = self._conversation_chunk_to_unified(conv_chunk)
+            if chunk:
+                self._last_chunk_ids.append(chunk.chunk_id)
+                counts["chunks"] += 1
+                yield chunk
+
+        logger.info(
+            "Created %d unified chunks from %d messages (%d conversations)",
+            counts["chunks"], counts["messages"], counts["conversations"],
+        )
+
     def index(
         self,
         days: Optional[int] = None,
@@ -204,25 +397,44 @@ class ImessageIndexer(BaseSourceIndexer):
         Returns:
             Dict with indexing stats
         """
-        start_time = datetime.now()
-
         # Store incremental flag for fetch_data
         kwargs["incremental"] = incremental
 
+        # Skip chunks indexed by earlier runs (a full reindex rebuilds all)
+        self._skip_chunk_ids = (
+            self.state.get_indexed_chunk_ids(self.state_key) if incremental else set()
+        )
+        self._last_chunk_ids = []
+
         # Call parent's index method
-        result = super().index(days=days, limit=limit, batch_size=batch_size, **kwargs)
+        try:
+            result = super().index(days=days, limit=limit, batch_size=batch_size, **kwargs)
+        finally:
+            self._skip_chunk_ids = set()
 
         # Update state on successful indexing (incremental mode only)
-        if result.get("success") and incremental and not days:
-            # Get the latest message timestamp from this indexing run
-            # We'll update state to current time (conservative approach)
-            # Alternatively, we could track max message timestamp from fetch_data
-            self.state.update_last_indexed("imessage", datetime.now())
-
+        # The watermarks are the newest message date and highest ROWID
+        # seen, which are on the same scales as the since-queries. Only
+        # this run's chunks can come round again once they have moved, so
+        # its chunk IDs replace the recorded ones. A run that fetched
+        # nothing leaves the state where it was.
+        if result.get("success") and incremental and not days and self._last_fetched_max_ts:
+            self.state.record_run(
+                self.state_key,
+                timestamp=self._last_fetched_max_ts,
+                rowid=self._last_fetched_max_rowid,
+                chunk_ids=self._last_chunk_ids,
+            )
             logger.info("Updated incremental index state")
 
         return result
 
+    def clear(self) -> int:
+        """Clear all indexed iMessage data, along with its incremental state."""
+        deleted = super().clear()
+        self.state.reset(self.state_key)
+        return deleted
+
     def _conversation_chunk_to_unified(
         self,
         conv_chunk: ConversationChunk,
@@ -237,47 +449,55 @@ class ImessageIndexer(BaseSourceIndexer):
             UnifiedChunk ready for indexing, or None if invalid
         """
         # Skip chunks that are too short (likely noise)
-        if not conv_chunk.text or conv_chunk.word_count < 10:
+        # word_count splits the whole text on each access, so it's read once
+        # (and only for non-empty text)
+        if not conv_chunk.text:
+            return None
+        word_count = conv_chunk.word_count
+        if word_count < 10:
             return None
 
         # Determine context type
         context_type = "conversation"  # For 1:1 and group chats
 
+        is_group = conv_chunk.is_group
+
         # Build title
-        if conv_chunk.is_group:
-            title = f"Group: {conv_chunk.group_name or 'Unnamed'}"
-        else:
-            title = f"Conversation with {conv_chunk.contact}"
+        title = _TITLE[is_group] % (
+            (conv_chunk.group_name or "Unnamed") if is_group else conv_chunk.contact,
+        )
 
         # Build participants list
-        participants = [conv_chunk.contact]
-        if conv_chunk.is_group:
+        # pool(s, s) returns the pooled instance of s (a C call, no frame)
+        pool = self._participant_pool.setdefault
+        contact = pool(conv_chunk.contact, conv_chunk.contact)
+        participants = [contact]
+        if is_group:
             # Extract unique phones from metadata
-            phones = conv_chunk.metadata.get("phones", [])
-            participants.extend(phones)
-            participants = list(set(participants))  # Deduplicate
+            phones = conv_chunk.metadata.get("phones") or _EMPTY_PHONES
+            if phones:
+                participants.extend(map(pool, phones, phones))
+                participants = list(dict.fromkeys(participants))  # Deduplicate, keeping order
 
         # Build tags
-        tags = []
-        if conv_chunk.is_group:
-            tags.append("group_chat")
+        tags = list(_TAGS[is_group])
 
         return UnifiedChunk(
             chunk_id=conv_chunk.chunk_id,  # Reuse conversation chunk ID
             source="imessage",
             text=conv_chunk.text,
             title=title,
-            context_id=conv_chunk.contact,
+            context_id=contact,
             context_type=context_type,
             timestamp=conv_chunk.start_time,
             end_timestamp=conv_chunk.end_time,
             participants=participants,
             tags=tags,
-            word_count=conv_chunk.word_count,
+            word_count=word_count,
             metadata={
                 "message_count": conv_chunk.message_count,
                 "duration_minutes": conv_chunk.duration_minutes,
-                "is_group": conv_chunk.is_group,
+                "is_group": is_group,
                 "group_name": conv_chunk.group_name or "",
             },
         )
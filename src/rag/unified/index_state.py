@@ -12,18 +12,26 @@ Similar to Kafka consumer offsets or database replication cursors.
 from pathlib import Path
 from datetime import datetime
 import json
-from typing import Optional
+from typing import Dict, Iterable, Optional, Set
 import logging
 
 logger = logging.getLogger(__name__)
 
+# State file key holding {source: [chunk_id, ...]} (kept apart from timestamps)
+INDEXED_CHUNKS_KEY = "_indexed_chunks"
+
+# State file key holding {source: last indexed row ID}
+LAST_ROWID_KEY = "_last_rowid"
+
 
 class IndexState:
     """
     Track last successful index time per source.
 
     Stores state in a JSON file for persistence across runs.
-    Each source (imessage, gmail, notes, etc.) has its own timestamp.
+    Each source (imessage, gmail, notes, etc.) has its own timestamp, and
+    optionally the IDs of the chunks its last run produced. Chunk IDs are
+    content hashes, so a known ID means an unchanged chunk.
 
     Args:
         state_file: Path to JSON state file (default: ~/.imessage_rag/index_state.json)
@@ -51,6 +59,8 @@ class IndexState:
         self.state_file = Path(state_file)
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
         self._state = {}
+        self._chunk_ids: Dict[str, Set[str]] = {}
+        self._rowids: Dict[str, int] = {}
         self._load()
 
     def _load(self):
@@ -59,19 +69,35 @@ class IndexState:
             try:
                 with open(self.state_file) as f:
                     self._state = json.load(f)
+                self._chunk_ids = {
+                    source: set(chunk_ids)
+                    for source, chunk_ids in self._state.pop(INDEXED_CHUNKS_KEY, {}).items()
+                }
+                self._rowids = self._state.pop(LAST_ROWID_KEY, {})
                 logger.info(f"Loaded index state from {self.state_file}")
             except (json.JSONDecodeError, IOError) as e:
                 logger.warning(f"Failed to load index state: {e}. Starting fresh.")
                 self._state = {}
+                self._chunk_ids = {}
+                self._rowids = {}
         else:
             logger.info(f"No existing index state at {self.state_file}")
             self._state = {}
+            self._chunk_ids = {}
+            self._rowids = {}
 
     def _save(self):
         """Save state to JSON file."""
+        data = dict(self._state)
+        if self._chunk_ids:
+            data[INDEXED_CHUNKS_KEY] = {
+                source: sorted(chunk_ids) for source, chunk_ids in self._chunk_ids.items()
+            }
+        if self._rowids:
+            data[LAST_ROWID_KEY] = dict(self._rowids)
         try:
             with open(self.state_file, 'w') as f:
-                json.dump(self._state, f, indent=2)
+                json.dump(data, f, indent=2)
             logger.debug(f"Saved index state to {self.state_file}")
         except IOError as e:
             logger.error(f"Failed to save index state: {e}")
@@ -109,6 +135,94 @@ class IndexState:
         self._save()
         logger.info(f"Updated index state for {source}: {timestamp.isoformat()}")
 
+    def get_last_rowid(self, source: str) -> Optional[int]:
+        """
+        Get the highest row ID indexed for source.
+
+        Args:
+            source: Source name (e.g., "imessage")
+
+        Returns:
+            Row ID of the newest indexed row, or None if never recorded
+        """
+        return self._rowids.get(source)
+
+    def update_last_rowid(self, source: str, rowid: int):
+        """
+        Update the highest row ID indexed for source.
+
+        Row IDs only grow as rows are inserted, so unlike a timestamp the
+        next run can resume strictly after it.
+
+        Args:
+            source: Source name (e.g., "imessage")
+            rowid: Row ID of the newest successfully indexed row
+
+        Note: Automatically saves to disk after updating.
+        """
+        self._rowids[source] = rowid
+        self._save()
+        logger.info(f"Updated last row ID for {source}: {rowid}")
+
+    def get_indexed_chunk_ids(self, source: str) -> Set[str]:
+        """
+        Get IDs of chunks already indexed for source.
+
+        Args:
+            source: Source name (e.g., "imessage")
+
+        Returns:
+            Set of chunk IDs (empty if none recorded)
+        """
+        return set(self._chunk_ids.get(source, ()))
+
+    def set_indexed_chunk_ids(self, source: str, chunk_ids: Iterable[str]):
+        """
+        Record the chunks the last run indexed for source.
+
+        Replaces the IDs recorded before: only chunks from the last run
+        can be produced again once the watermark has moved past them.
+
+        Args:
+            source: Source name (e.g., "imessage")
+            chunk_ids: IDs of chunks now in the store
+
+        Note: Automatically saves to disk after updating.
+        """
+        self._chunk_ids[source] = set(chunk_ids)
+        self._save()
+        logger.info(f"Recorded {len(self._chunk_ids[source])} indexed chunks for {source}")
+
+    def record_run(
+        self,
+        source: str,
+        timestamp: Optional[datetime] = None,
+        rowid: Optional[int] = None,
+        chunk_ids: Optional[Iterable[str]] = None,
+    ):
+        """
+        Record the outcome of a successful run with a single save.
+
+        Args:
+            source: Source name (e.g., "imessage")
+            timestamp: New last indexed timestamp (None = unchanged)
+            rowid: New highest indexed row ID (None = unchanged)
+            chunk_ids: IDs of the chunks the run indexed (None = unchanged),
+                replacing those recorded before
+
+        Note: Saves to disk only if anything changed.
+        """
+        if timestamp is None and rowid is None and chunk_ids is None:
+            return
+        if timestamp is not None:
+            self._state[source] = timestamp.isoformat()
+        if rowid is not None:
+            self._rowids[source] = rowid
+        if chunk_ids is not None:
+            self._chunk_ids[source] = set(chunk_ids)
+        self._save()
+        logger.info(f"Updated index state for {source}")
+
     def reset(self, source: Optional[str] = None):
         """
         Reset state for source (or all if None).
@@ -127,8 +241,12 @@ class IndexState:
             if source in self._state:
                 del self._state[source]
                 logger.info(f"Reset index state for {source}")
+            self._chunk_ids.pop(source, None)
+            self._rowids.pop(source, None)
         else:
             self._state = {}
+            self._chunk_ids = {}
+            self._rowids = {}
             logger.info("Reset all index state")
 
         self._save()
@@ -37,6 +37,7 @@ class UnifiedRetriever:
     Args:
         persist_directory: ChromaDB storage location
         use_local_embeddings: Use local embeddings instead of OpenAI
+        embedding_dimensions: Shortened OpenAI embedding size (None = full)
 
     Example:
         retriever = UnifiedRetriever()
@@ -56,6 +57,7 @@ class UnifiedRetriever:
         self,
         persist_directory: Optional[str] = None,
         use_local_embeddings: bool = False,
+        embedding_dimensions: Optional[int] = None,
     ):
         # Default persist directory
         if persist_directory is None:
@@ -65,6 +67,7 @@ class UnifiedRetriever:
         self.store = UnifiedVectorStore(
             persist_directory=persist_directory,
             use_local_embeddings=use_local_embeddings,
+            embedding_dimensions=embedding_dimensions,
         )
 
         # Lazy-initialize indexers
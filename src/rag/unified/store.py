@@ -46,6 +46,9 @@ class UnifiedVectorStore:
     Args:
         persist_directory: Where to store ChromaDB data
         use_local_embeddings: Use local embeddings instead of OpenAI
+        embedding_dimensions: Store shortened OpenAI embeddings of this size.
+            They go in separate collections, since a collection holds
+            vectors of one size.
 
     Example:
         store = UnifiedVectorStore()
@@ -60,6 +63,7 @@ class UnifiedVectorStore:
         self,
         persist_directory: Optional[str] = None,
         use_local_embeddings: bool = False,
+        embedding_dimensions: Optional[int] = None,
     ):
         # Default persist directory
         if persist_directory is None:
@@ -68,6 +72,7 @@ class UnifiedVectorStore:
 
         self.persist_directory = persist_directory
         self.use_local_embeddings = use_local_embeddings
+        self.embedding_dimensions = embedding_dimensions
 
         # Ensure directory exists
         Path(persist_directory).mkdir(parents=True, exist_ok=True)
@@ -78,13 +83,23 @@ class UnifiedVectorStore:
 
         # Initialize embedding provider (shared across collections)
         from ..store import EmbeddingProvider
-        self.embedder = EmbeddingProvider(use_local=use_local_embeddings)
+        self.embedder = EmbeddingProvider(
+            use_local=use_local_embeddings,
+            dimensions=embedding_dimensions,
+        )
 
         # Collection cache
         self._collections: Dict[str, Any] = {}
 
         logger.info(f"Initialized UnifiedVectorStore at {persist_directory}")
 
+    def _collection_name(self, source: str) -> str:
+        """ChromaDB collection name for a source."""
+        name = f"{self.COLLECTION_PREFIX}{source}_chunks"
+        if self.embedding_dimensions is not None:
+            name += f"_d{self.embedding_dimensions}"
+        return name
+
     def _get_collection(self, source: str):
         """
         Get or create collection for a source type.
@@ -95,7 +110,7 @@ class UnifiedVectorStore:
             raise ValueError(f"Invalid source: {source}")
 
         if source not in self._collections:
-            collection_name = f"{self.COLLECTION_PREFIX}{source}_chunks"
+            collection_name = self._collection_name(source)
             self._collections[source] = self.client.get_or_create_collection(
                 name=collection_name,
                 metadata={"hnsw:space": "cosine"},
@@ -113,7 +128,8 @@ class UnifiedVectorStore:
         Add chunks to appropriate collections.
 
         Chunks are automatically routed to their source-specific collection.
-        Existing chunks (by chunk_id) are skipped.
+        Existing chunks (by chunk_id) are skipped. New chunks are embedded in
+        batch_size slices in the order given.
 
         Args:
             chunks: List of UnifiedChunk objects
@@ -137,8 +153,10 @@ class UnifiedVectorStore:
         for source, source_chunks in by_source.items():
             collection = self._get_collection(source)
 
-            # Filter out existing chunks
-            existing_ids = set(collection.get()["ids"])
+            # Filter out existing chunks (looking up only this call's IDs,
+            # since index() calls this once per batch)
+            chunk_ids = list(dict.fromkeys(c.chunk_id for c in source_chunks))
+            existing_ids = set(collection.get(ids=chunk_ids, include=[])["ids"])
             new_chunks = [c for c in source_chunks if c.chunk_id not in existing_ids]
 
             if not new_chunks:
@@ -384,7 +402,7 @@ class UnifiedVectorStore:
             if src not in SOURCE_TYPES:
                 continue
 
-            collection_name = f"{self.COLLECTION_PREFIX}{src}_chunks"
+            collection_name = self._collection_name(src)
             try:
                 collection = self.client.get_collection(collection_name)
                 count = collection.count()
@@ -53,6 +53,34 @@ def test_load_contacts(temp_contacts_file):
     assert manager.contacts[1].name == "Jane Smith"
 
 
+def test_load_contacts_from_data():
+    """Test building contacts from pre-parsed data without reading the file."""
+    manager = ContactsManager(
+        "/nonexistent/contacts.json",
+        contacts_data=[{"name": "John Doe", "phone": "+14155551234"}]
+    )
+
+    assert len(manager.contacts) == 1
+    assert manager.contacts[0].relationship_type == "other"
+    assert not Path("/nonexistent/contacts.json").exists()
+
+
+def test_load_contacts_large_config(tmp_path):
+    """Test loading a config big enough to be parsed from a memory map."""
+    config_path = tmp_path / "contacts.json"
+    config_path.write_text(json.dumps({
+        "contacts": [
+            {"name": f"Person {i}", "phone": f"+1415555{i:04d}"}
+            for i in range(2000)
+        ]
+    }))
+
+    manager = ContactsManager(str(config_path))
+
+    assert len(manager.contacts) == 2000
+    assert manager.get_contact_by_phone("4155551999").name == "Person 1999"
+
+
 def test_get_contact_by_name_exact_match(temp_contacts_file):
     """Test exact name matching."""
     manager = ContactsManager(temp_contacts_file)
@@ -114,6 +142,21 @@ def test_get_contact_by_phone_without_country_code(temp_contacts_file):
     assert contact.name == "Jane Smith"
 
 
+def test_get_contacts_by_phones(temp_contacts_file):
+    """Test batch phone lookup matches single lookups."""
+    manager = ContactsManager(temp_contacts_file)
+
+    phones = ["4155551234", "+14155555678", "+19999999999", "4155551234"]
+    contacts = manager.get_contacts_by_phones(phones)
+
+    assert list(contacts) == ["4155551234", "+14155555678", "+19999999999"]
+    assert contacts["4155551234"].name == "John Doe"
+    assert contacts["+14155555678"].name == "Jane Smith"
+    assert contacts["+19999999999"] is None
+    for phone in phones:
+        assert contacts[phone] is manager.get_contact_by_phone(phone)
+
+
 def test_list_contacts(temp_contacts_file):
     """Test listing all contacts."""
     manager = ContactsManager(temp_contacts_file)
@@ -144,6 +187,35 @@ def test_add_contact(temp_contacts_file):
     found = manager.get_contact_by_name("New Person")
     assert found is not None
     assert found.phone == "+14155559999"
+    assert manager.get_contact_by_phone("4155559999") is new_contact
+    assert manager.get_contact_by_name("new pers") is new_contact
+
+
+def test_get_contact_by_phone_prefers_first_match():
+    """Test that the earliest suffix match wins, as with a linear scan."""
+    manager = ContactsManager(
+        "/nonexistent/contacts.json",
+        contacts_data=[
+            {"name": "Local Format", "phone": "4155551234"},
+            {"name": "E164 Format", "phone": "+14155551234"},
+        ]
+    )
+
+    assert manager.get_contact_by_phone("+14155551234").name == "Local Format"
+    assert manager.get_contact_by_phone("5551234").name == "Local Format"
+
+
+def test_get_contact_by_phone_after_add_contact(temp_contacts_file):
+    """Test that a phone lookup that missed finds a contact added later."""
+    manager = ContactsManager(temp_contacts_file)
+
+    assert manager.get_contact_by_phone("+12125550100") is None
+    assert manager.get_contact_by_phone("+14155551234").name == "John Doe"
+
+    added = manager.add_contact(name="New York", phone="2125550100")
+
+    assert manager.get_contact_by_phone("+12125550100") is added
+    assert manager.get_contact_by_phone("+14155551234").name == "John Doe"
 
 
 def test_contact_to_dict():
@@ -101,3 +101,73 @@ def test_index_state_get_all_states(tmp_path):
     assert "imessage" in all_states
     assert "gmail" in all_states
     assert len(all_states) == 2
+
+
+def test_index_state_chunk_ids_persist(tmp_path):
+    """Indexed chunk IDs persist per source, apart from timestamps."""
+    state_file = tmp_path / "state.json"
+
+    state1 = IndexState(state_file)
+    state1.update_last_indexed("imessage", datetime.now())
+    state1.set_indexed_chunk_ids("imessage", ["abc123", "def456"])
+
+    state2 = IndexState(state_file)
+    assert state2.get_indexed_chunk_ids("imessage") == {"abc123", "def456"}
+    assert state2.get_indexed_chunk_ids("gmail") == set()
+    assert list(state2.get_all_states()) == ["imessage"]
+
+
+def test_index_state_chunk_ids_replaced(tmp_path):
+    """Recording chunk IDs replaces those of the previous run."""
+    state_file = tmp_path / "state.json"
+    state = IndexState(state_file)
+
+    state.set_indexed_chunk_ids("imessage", ["abc123", "def456"])
+    state.set_indexed_chunk_ids("imessage", ["ghi789"])
+
+    assert IndexState(state_file).get_indexed_chunk_ids("imessage") == {"ghi789"}
+
+
+def test_index_state_reset_clears_chunk_ids(tmp_path):
+    """Resetting a source forgets its indexed chunk IDs."""
+    state_file = tmp_path / "state.json"
+    state = IndexState(state_file)
+
+    state.set_indexed_chunk_ids("imessage", ["abc123"])
+    state.set_indexed_chunk_ids("notes", ["def456"])
+    state.reset("imessage")
+
+    assert state.get_indexed_chunk_ids("imessage") == set()
+    assert IndexState(state_file).get_indexed_chunk_ids("notes") == {"def456"}
+
+
+def test_index_state_last_rowid(tmp_path):
+    """The row ID watermark persists per source and is cleared by reset."""
+    state_file = tmp_path / "state.json"
+
+    state1 = IndexState(state_file)
+    assert state1.get_last_rowid("imessage") is None
+    state1.update_last_indexed("imessage", datetime.now())
+    state1.update_last_rowid("imessage", 4242)
+
+    state2 = IndexState(state_file)
+    assert state2.get_last_rowid("imessage") == 4242
+    assert list(state2.get_all_states()) == ["imessage"]
+
+    state2.reset("imessage")
+    assert IndexState(state_file).get_last_rowid("imessage") is None
+
+
+def test_index_state_record_run(tmp_path):
+    """record_run stores a run's watermarks and chunk IDs together."""
+    state_file = tmp_path / "state.json"
+    state = IndexState(state_file)
+    now = datetime.now()
+
+    state.record_run("imessage", timestamp=now, rowid=4242, chunk_ids=["abc123"])
+    state.record_run("imessage", rowid=4343)
+
+    loaded = IndexState(state_file)
+    assert loaded.get_last_indexed("imessage") == now
+    assert loaded.get_last_rowid("imessage") == 4343
+    assert loaded.get_indexed_chunk_ids("imessage") == {"abc123"}
@@ -89,6 +89,19 @@ def test_chunk_data_basic(indexer):
         assert chunk.timestamp is not None
 
 
+def test_iter_chunks_matches_chunk_data(indexer):
+    """Test that streaming chunks yields the same chunks as fetch + chunk."""
+    messages = indexer.fetch_data(limit=100, incremental=False)
+
+    if not messages:
+        pytest.skip("No messages available for testing")
+
+    chunks = indexer.chunk_data(messages)
+    streamed = list(indexer.iter_chunks(limit=100, incremental=False))
+
+    assert sorted(c.chunk_id for c in streamed) == sorted(c.chunk_id for c in chunks)
+
+
 def test_chunk_conversion(indexer):
     """Test ConversationChunk to UnifiedChunk conversion."""
     from src.rag.chunker import ConversationChunk
@@ -145,6 +158,30 @@ def test_group_chat_conversion(indexer):
     assert len(unified_chunk.participants) > 1  # Should have multiple participants
 
 
+def test_group_chat_participant_order(indexer):
+    """Test that group participants keep first-seen order on every run."""
+    phones = ["+15550000003", "+15550000001", "+15550000002", "+15550000001"]
+    messages = [
+        {
+            "text": f"message number {i} in the group chat about weekend plans",
+            "date": f"2026-01-01T10:0{i}:00",
+            "is_from_me": False,
+            "phone": phone,
+            "is_group_chat": True,
+            "group_id": "chat123",
+        }
+        for i, phone in enumerate(phones)
+    ]
+
+    runs = [
+        [c.participants for c in indexer.chunk_data([dict(m) for m in messages])]
+        for _ in range(2)
+    ]
+
+    assert runs[0] == runs[1]
+    assert runs[0][0] == ["chat123", "+15550000003", "+15550000001", "+15550000002"]
+
+
 def test_short_chunks_filtered(indexer):
     """Test that very short chunks are filtered out."""
     from src.rag.chunker import ConversationChunk